@@ -12,12 +12,31 @@ import re
 import argparse
 import html
 import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 import logging
-from bs4 import BeautifulSoup
+from functools import lru_cache
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
 
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Use orjson for JSONL encoding/decoding when available (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Import Myanmar tools for Zawgyi conversion
 try:
     from myanmartools import ZawgyiDetector
@@ -40,12 +59,508 @@ except ImportError as e:
     myanmar_segmenter = None
     logger.warning(f"Myanmar word library not available: {e}")
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+def loads_jsonl(line: bytes) -> Any:
+    """Decode one UTF-8 JSONL line (orjson.JSONDecodeError subclasses json.JSONDecodeError)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def dumps_jsonl(item: Dict[str, Any]) -> bytes:
+    """Encode one item as a compact, non-ASCII-escaped UTF-8 JSONL line (without newline)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(item)
+    return json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Buffer size for JSONL input/output files and number of output lines written per batch
+IO_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 1024
+
+# Precompiled regex patterns (compiled once at import instead of per call)
+_RE_WS = re.compile(r'\s+')
+_RE_MYANMAR = re.compile(r'[\u1000-\u109F]')
+_RE_DASHES = re.compile(r'-{2,}')
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_HTML_ENTITY = re.compile(r'&#?\w+;')
+_ZAWGYI_SEPARATORS = ('ZG ', 'Zawgyi ', 'ZAWGYI', '[Zawgyi]', 'ZawGyi')  # In priority order
+_RE_BOTUPLOAD_LINE = re.compile(r'^.*botupload.*(?:\n|$)', re.IGNORECASE | re.MULTILINE)
+
+# Xinhua-specific patterns
+_RE_XINHUA_DASH = re.compile(r'————.*$', re.MULTILINE)
+_XINHUA_END_RES = [re.compile(p) for p in (
+    r'\s*\([Xx][Ii][Nn][Hh][Uu][Aa]/[^)]+\)\s*[.။]*\s*$',  # (Xinhua/Author) at end
+    r'\s*\([Xx][Ii][Nn][Hh].*?\)\s*[.။]*\s*$',  # English (Xinh*) - catches misspellings
+    r'\s*\([Xx][Ii][Nn][Hh][Uu][Aa]\)\s*[.။]*\s*$',  # English (Xinhua) - exact match
+    r'\s*\(ဆင်ဟွာ\)\s*[.။]*\s*$',  # Myanmar (ဆင်ဟွာ)
+)]
+_XINHUA_RES = [re.compile(p) for p in (
+    r'\([Xx][Ii][Nn][Hh][Uu][Aa]/[^)]+\)',  # (Xinhua/Author) anywhere
+    r'\([Xx][Ii][Nn][Hh].*?\)',  # English (Xinh*) - catches misspellings
+    r'\([Xx][Ii][Nn][Hh][Uu][Aa]\)',  # English (Xinhua) - exact match
+    r'\(ဆင်ဟွာ\)',  # Myanmar (ဆင်ဟွာ)
+)]
+_RE_LEADING_ELLIPSIS = re.compile(r'^…+', re.MULTILINE)
+# Cheap pre-check: text without any of these cannot be changed by the Xinhua patterns
+_RE_XINHUA_HINT = re.compile(r'————|…|\([Xx][Ii][Nn][Hh]|\(ဆင်ဟွာ\)|english|chinese', re.IGNORECASE)
+_VERSION_RES = [re.compile(p, re.DOTALL | re.IGNORECASE) for p in (
+    # English version patterns (with common misspellings)
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ers?i?o?n+(?:\))?.*',
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ersi+on+(?:\))?.*',
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ersion+(?:\))?.*',
+    # Chinese version patterns (with common misspellings)
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ers?i?o?n+(?:\))?.*',
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ersi+on+(?:\))?.*',
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ersion+(?:\))?.*',
+    # Exact case patterns (fallback)
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?English\s*Version(?:\))?.*',
+    r'[^a-zA-Z\u1000-\u109F]*(?:\()?Chinese\s*Version(?:\))?.*',
+)]
+
+# Myanmar references section: == ကိုးကား ==
+_RE_REFERENCES = re.compile(r'\s*==\s*ကိုးကား\s*==\s*')
+
+# Navigation and menu patterns
+_NAV_PATTERNS = (
+    r'menu\s*[:：]\s*.*?(?=\n|$)',
+    r'navigation\s*[:：]\s*.*?(?=\n|$)',
+    r'breadcrumb\s*[:：]\s*.*?(?=\n|$)',
+    r'home\s*[>›]\s*.*?(?=\n|$)',
+    r'သင်္ကေတ\s*[:：]\s*.*?(?=\n|$)',  # Myanmar "symbol/menu"
+    r'မူလစာမျက်နှာ\s*[>›]\s*.*?(?=\n|$)',  # Myanmar "home page"
 )
-logger = logging.getLogger(__name__)
+
+# Advertisement patterns
+_AD_PATTERNS = (
+    r'advertisement\s*[:：]?.*?(?=\n|$)',
+    r'sponsored\s*[:：]?.*?(?=\n|$)',
+    r'ads?\s*[:：]?.*?(?=\n|$)',
+    r'ကြော်ငြာ\s*[:：]?.*?(?=\n|$)',  # Myanmar "advertisement"
+    r'click\s+here.*?(?=\n|$)',
+    r'read\s+more.*?(?=\n|$)',
+    r'continue\s+reading.*?(?=\n|$)',
+)
+
+# Copyright and disclaimer patterns
+_LEGAL_PATTERNS = (
+    r'copyright\s*[©℗]?\s*\d{4}.*?(?=\n|$)',
+    r'all\s+rights?\s+reserved.*?(?=\n|$)',
+    r'disclaimer\s*[:：]?.*?(?=\n|$)',
+    r'terms?\s+of\s+use.*?(?=\n|$)',
+    r'privacy\s+policy.*?(?=\n|$)',
+    r'မူပိုင်ခွင့်.*?(?=\n|$)',  # Myanmar "copyright"
+    r'တရားဝင်.*?(?=\n|$)',  # Myanmar "legal"
+)
+
+# Webpage buttons and interactive elements
+_BUTTON_PATTERNS = (
+    r'\[?\s*share\s*\]?',
+    r'\[?\s*like\s*\]?',
+    r'\[?\s*comment\s*\]?',
+    r'\[?\s*subscribe\s*\]?',
+    r'\[?\s*follow\s*\]?',
+    r'\[?\s*tweet\s*\]?',
+    r'\[?\s*facebook\s*\]?',
+    r'\[?\s*twitter\s*\]?',
+    r'\[?\s*download\s*\]?',
+    r'\[?\s*print\s*\]?',
+)
+
+# Line-level noise (navigation, ads, legal) and buttons, compiled once and applied in this
+# order; not fused into one alternation, since leftmost-match would change what each pass removes
+_LINE_NOISE_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in _NAV_PATTERNS + _AD_PATTERNS + _LEGAL_PATTERNS]
+_BUTTON_RES = [re.compile(p, re.IGNORECASE) for p in _BUTTON_PATTERNS]
+
+# Unicode control and format characters
+# U+200E (Left-to-Right Mark), U+200F (Right-to-Left Mark)
+# U+202A-U+202E (Directional formatting characters)
+# U+2060 (Word Joiner), U+FEFF (Zero Width No-Break Space/BOM)
+_CONTROL_CHARS = (
+    '\u200E',  # Left-to-Right Mark
+    '\u200F',  # Right-to-Left Mark
+    '\u202A',  # Left-to-Right Embedding
+    '\u202B',  # Right-to-Left Embedding
+    '\u202C',  # Pop Directional Formatting
+    '\u202D',  # Left-to-Right Override
+    '\u202E',  # Right-to-Left Override
+    '\u2060',  # Word Joiner
+    '\uFEFF',  # Zero Width No-Break Space (BOM)
+    '\u00AD',  # Soft Hyphen
+    '\u200B',  # Zero Width Space
+    '\u200C',  # Zero Width Non-Joiner
+    '\u200D',  # Zero Width Joiner
+    '\u2028',  # Line Separator
+    '\u2029',  # Paragraph Separator
+)
+
+# Non-breaking space and other special spaces
+_SPECIAL_SPACES = (
+    '\xa0',    # Non-breaking space
+    '\u2000',  # En quad
+    '\u2001',  # Em quad
+    '\u2002',  # En space
+    '\u2003',  # Em space
+    '\u2004',  # Three-per-em space
+    '\u2005',  # Four-per-em space
+    '\u2006',  # Six-per-em space
+    '\u2007',  # Figure space
+    '\u2008',  # Punctuation space
+    '\u2009',  # Thin space
+    '\u200A',  # Hair space
+    '\u3000',  # Ideographic space
+)
+
+# Control characters are dropped and special spaces become a regular space in one pass
+_CONTROL_SPACE_TRANS = str.maketrans({
+    **{ord(c): None for c in _CONTROL_CHARS},
+    **{ord(c): ' ' for c in _SPECIAL_SPACES},
+})
+
+# Additional HTML entity replacements (extended list), applied in order: decoding '&amp;'
+# early can expose entities that later passes still pick up
+_HTML_ENTITIES = {
+    '&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"',
+    '&apos;': "'", '&copy;': '©', '&reg;': '®', '&trade;': '™',
+    '&#39;': "'", '&#34;': '"', '&#8217;': "'", '&#8220;': '"', '&#8221;': '"',
+    '&#8216;': "'", '&#8218;': "'", '&#8222;': '"', '&#8230;': '...',
+    '&#8211;': '–', '&#8212;': '—', '&#8226;': '•', '&#8482;': '™',
+    '&#169;': '©', '&#174;': '®', '&#8364;': '€', '&#163;': '£',
+    '&#8594;': '→', '&#8592;': '←', '&#8593;': '↑', '&#8595;': '↓',
+    '&mdash;': '—', '&ndash;': '–', '&ldquo;': '"', '&rdquo;': '"',
+    '&lsquo;': "'", '&rsquo;': "'", '&hellip;': '...', '&bull;': '•',
+}
+
+# Escaped quote characters replaced with spaces
+_QUOTE_TRANS = str.maketrans({'"': ' ', '\\': ' '})
+
+# Special symbols and artistic characters
+_SPECIAL_SYMBOLS = (
+    '★', '☆', '♪', '♫', '♬', '♩', '♭', '♮', '♯',  # stars and music
+    '♠', '♣', '♥', '♦',  # card suits
+    '▲', '▼', '◆', '◇', '○', '●', '□', '■',  # geometric shapes
+    '→', '←', '↑', '↓', '↔', '↕',  # arrows
+    '※', '§', '¶', '†', '‡', '•', '‰', '‱',  # misc symbols
+    '℃', '℉', '°', '′', '″', '‴',  # degree and temperature
+)
+_SYMBOL_TRANS = str.maketrans('', '', ''.join(_SPECIAL_SYMBOLS))
+
+# Emojis and artistic symbols (a character-class regex; a str.translate table over these
+# ranges would need ~120k entries and measures about 3x slower on typical article text)
+_RE_EMOJI = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"  # enclosed characters
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
+    "]+", flags=re.UNICODE
+)
+
+# Line break, spacing and indentation normalization
+_RE_MULTI_NEWLINE = re.compile(r'\n{3,}')
+_RE_SPACED_NEWLINES = re.compile(r'\n\s*\n\s*\n')
+_RE_LONG_SPACES = re.compile(r' {3,}')
+_RE_DEEP_INDENT = re.compile(r'^\s{4,}', re.MULTILINE)
+_RE_TAB_INDENT = re.compile(r'^\t+', re.MULTILINE)
+_RE_SPACES_TABS = re.compile(r'[ \t]+')
+
+# Table and formula conversion patterns
+# Each entry carries a literal the pattern cannot match without, checked before scanning
+_TABLE_RES = [(re.compile(p, re.MULTILINE), required) for p, required in (
+    (r'(\|[^|\n]+\|[^|\n]*\n)+', '|'),  # Pipe-separated tables
+    (r'((?:[^\n\t]{2,}\t[^\n\t]{2,}(?:\t[^\n\t]{2,})*\n){2,})', '\t'),  # Tab-separated tables
+)]
+_MATH_RES = [(re.compile(p), r, required) for p, r, required in (
+    (r'(\d+)\s*\^\s*(\d+)', r'$\1^{\2}$', '^'),  # Exponents: 2^3 -> $2^{3}$
+    (r'sqrt\(([^)]+)\)', r'$\\sqrt{\1}$', 'sqrt('),  # Square root: sqrt(x) -> $\sqrt{x}$
+)]
+_RE_FRACTION = re.compile(r'(\d+)\s*/\s*(\d+)')
+_RE_MYANMAR_DIGIT = re.compile(r'[၀-၉]')
+# Context words marking a number/number as a legal reference or license plate, not a fraction
+_LEGAL_INDICATORS = (
+    'ပုဒ်မ', 'ကြီး', 'ယာဉ်', 'လိုင်စင်', 'အမှတ်', 'နံပါတ်',  # Myanmar legal terms
+    'section', 'article', 'law', 'act', 'license', 'number',  # English legal terms
+    '(က)', '(ခ)', '(ဂ)', '(ပ)', '(ဖ)', '(ဗ)', '(မ)',  # Myanmar subsection markers
+    'YGN', 'MDY', 'NPT', 'MGW', 'BGA', 'PGO', 'TNU', 'KYT',  # Myanmar city codes
+    'TOYOTA', 'HONDA', 'NISSAN', 'MAZDA', 'HYUNDAI', 'KIA', 'FORD',  # Car brands
+    'BUS', 'TRUCK', 'CAR', 'TAXI', 'VAN', 'MOTORCYCLE',  # Vehicle types
+)
+_RE_LEGAL_INDICATOR = re.compile('|'.join(re.escape(i) for i in _LEGAL_INDICATORS))
+_RE_LICENSE_PLATE = re.compile('|'.join((
+    r'[A-Z]{2,4}-\d+/\d+[A-Z]?-[A-Z\d]+',  # YGN-40/7N-XXXX
+    r'[A-Z]{2,4}\s*-\s*\d+\s*/\s*\d+',     # YGN-40/7 or YGN - 40/7
+    r'\d+\s*/\s*\d+[A-Z]',                  # 40/7N
+    r'[A-Z]\s*\d+\s*/\s*\d+',              # A40/7
+    r'\w+/\d+/\d+\.\w+',                    # file paths like t33/1/16/2705.png
+    r'\d+/\d+/\d+\.\w+',                    # numeric paths like 33/1/16/2705.png
+    r'[a-zA-Z0-9_-]+/\d+/\d+',             # directory/number/number patterns
+)))
+# File extensions in a fraction's context (ASCII-only case folding, like str.lower on these letters)
+_RE_FILE_EXTENSION = re.compile(r'\.(?:png|jpg|jpeg|gif|svg|webp|bmp|pdf|doc|txt)', re.IGNORECASE | re.ASCII)
+_RE_PATH_SEGMENT = re.compile(r'[a-zA-Z0-9_-]+/')
+_RE_EQUATION = re.compile(r'([a-zA-Z])\s*=\s*([^,\n]+)')
+
+# Content quality checks
+_RE_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+# Runs of characters that are not Myanmar, word characters, whitespace or common punctuation
+_RE_INVALID_CHARS = re.compile(r'[^\u1000-\u109F\w\s.,!?;:()"\'-]+')
+# Incoherent sequences, each set fused into one alternation so the text is scanned once
+_RE_INCOHERENT = re.compile('|'.join((
+    r'[a-zA-Z]{20,}',  # Very long English words (likely garbled)
+    r'[\u1000-\u109F]{30,}',  # Very long Myanmar sequences without spaces
+    r'[0-9]{15,}',  # Very long number sequences
+)))
+_RE_SEVERE_INCOHERENT = re.compile('|'.join((
+    r'[a-zA-Z]{50,}',  # Extremely long English words (was 20+)
+    r'[\u1000-\u109F]{100,}',  # Extremely long Myanmar sequences (was 30+)
+    r'[0-9]{30,}',  # Extremely long number sequences (was 15+)
+)))
+
+# Non-countable content removed before word counting. Each pass is one alternation; the passes
+# stay separate because a URL glued to an [IMAGE] tag or to preceding text must be cut exactly
+# where the previous sequence of single-pattern substitutions cut it
+_RE_IMAGE_TAG = re.compile(r'\[(?:IMAGE|IMG|PHOTO|PIC)[^\]]*\]', re.IGNORECASE)  # [IMAGE] tags and variations
+_RE_PREFIXED_URL = re.compile(r'(?:https?|ftp)://[^\s]+|www\.[^\s]+', re.IGNORECASE)  # http/https/ftp/www URLs
+_RE_BARE_DOMAIN = re.compile(r'[^\s]+\.[a-z]{2,}(?:/[^\s]*)?', re.IGNORECASE)  # domain.com style URLs
+_RE_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Characters that make lxml's text output differ from the input itself (markup, entities,
+# carriage returns, NUL, BOM and lone surrogates); text without them needs no parsing
+_RE_NEEDS_PARSER = re.compile('[<&\r\x00\ufeff\ud800-\udfff]')
+
+# Selector parsing helpers for building parse-only strainers
+_RE_SIMPLE_SELECTOR = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+)*)$')
+_RE_SELECTOR_COMBINATOR = re.compile(r'\s*>\s*|\s+')
+
+
+def _parse_simple_selector(selector: str):
+    """Parse a compound like 'div.article#main' into (tag, classes, id), or None if not that simple"""
+    match = _RE_SIMPLE_SELECTOR.match(selector)
+    if not match or not selector:
+        return None
+    
+    tag = match.group('tag').lower() if match.group('tag') else None
+    classes = []
+    element_id = None
+    for part in re.findall(r'[.#][\w-]+', match.group('rest')):
+        if part[0] == '.':
+            classes.append(part[1:])
+        elif element_id is None:
+            element_id = part[1:]
+        else:
+            return None
+    return tag, classes, element_id
+
+
+def _selector_root(selector: str):
+    """Get the leftmost compound of a descendant/child-only selector, or None"""
+    selector = selector.strip()
+    if not selector or any(c in selector for c in ',+~:[*'):
+        return None
+    return _parse_simple_selector(_RE_SELECTOR_COMBINATOR.split(selector)[0])
+
+
+def _attr_value_matcher(values):
+    """Match an attribute value (raw or split class list) against any of the given values"""
+    values = set(values)
+    return lambda value: bool(value) and any(v in values for v in str(value).split())
+
+
+def build_selector_strainer(selectors: List[str]):
+    """
+    Build a SoupStrainer that keeps the root elements of the given selectors
+    
+    The strainer may keep more than strictly needed (it matches the union of
+    tags, classes and ids), but never less, so selecting on the strained tree
+    gives the same result as on the full document. Returns None when any
+    selector is too complex to derive a root from.
+    """
+    roots = []
+    for selector in selectors:
+        if not selector:
+            continue
+        root = _selector_root(selector)
+        if root is None:
+            return None
+        roots.append(root)
+    
+    if not roots:
+        return None
+    
+    # Each constraint only applies if every root has it (otherwise it would drop elements)
+    names = None
+    if all(tag for tag, _, _ in roots):
+        names = sorted({tag for tag, _, _ in roots})
+    
+    attrs = {}
+    if all(classes for _, classes, _ in roots):
+        attrs['class'] = _attr_value_matcher(classes[0] for _, classes, _ in roots)
+    if all(element_id for _, _, element_id in roots):
+        attrs['id'] = _attr_value_matcher(element_id for _, _, element_id in roots)
+    
+    if names is None and not attrs:
+        return None
+    
+    return SoupStrainer(names, attrs=attrs)
+
+
+class _FindSelector:
+    """Match a simple 'tag.class#id' selector with find/find_all, skipping the CSS engine"""
+    
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+    
+    def select(self, soup):
+        return soup.find_all(self.tag, attrs=self.attrs)
+    
+    def select_one(self, soup):
+        return soup.find(self.tag, attrs=self.attrs)
+
+
+@lru_cache(maxsize=None)
+def compile_css_selector(selector: str):
+    """
+    Compile a CSS selector once and reuse the matcher (raises on invalid syntax)
+    
+    Simple selectors (a tag, at most one class and an id) are dispatched to
+    find/find_all; everything else goes through a compiled soupsieve matcher.
+    Both expose select(soup) and select_one(soup).
+    """
+    parsed = _parse_simple_selector(selector.strip())
+    if parsed is not None and len(parsed[1]) <= 1:
+        tag, classes, element_id = parsed
+        attrs = {}
+        if classes:
+            attrs['class'] = classes[0]
+        if element_id:
+            attrs['id'] = element_id
+        return _FindSelector(tag, attrs)
+    
+    return soupsieve.compile(selector)
+
+
+# Table, fraction and equation converters used as re.sub callbacks by convert_tables_and_formulas
+def _convert_table_to_latex(match):
+    """Convert a matched pipe- or tab-separated table to a LaTeX tabular"""
+    table_text = match.group(0).strip()
+    lines = table_text.split('\n')
+
+    if '|' in table_text:
+        # Pipe-separated table
+        rows = []
+        for line in lines:
+            if '|' in line:
+                cells = [cell.strip() for cell in line.split('|') if cell.strip()]
+                if cells:
+                    rows.append(' & '.join(cells) + ' \\\\')
+
+        if rows:
+            col_count = len(rows[0].split(' & '))
+            latex_table = f"\\begin{{tabular}}{{{('c' * col_count)}}}\n"
+            latex_table += '\n'.join(rows)
+            latex_table += "\n\\end{tabular}"
+            return latex_table
+
+    elif '\t' in table_text:
+        # Tab-separated table
+        rows = []
+        for line in lines:
+            if '\t' in line:
+                cells = [cell.strip() for cell in line.split('\t') if cell.strip()]
+                if cells:
+                    rows.append(' & '.join(cells) + ' \\\\')
+
+        if rows:
+            col_count = len(rows[0].split(' & '))
+            latex_table = f"\\begin{{tabular}}{{{('c' * col_count)}}}\n"
+            latex_table += '\n'.join(rows)
+            latex_table += "\n\\end{tabular}"
+            return latex_table
+
+    return match.group(0)  # Return original if conversion fails
+
+def _convert_fraction(match):
+    """Convert num/num to a LaTeX fraction unless its context marks a reference, plate or path"""
+    # match.string is the text being substituted, so the context needs no closure over it
+    full_match = match.group(0)
+    text = match.string
+    before_context = text[max(0, match.start()-20):match.start()]
+    after_context = text[match.end():match.end()+20]
+
+    # Check if this looks like a legal document reference or license plate
+    context = before_context + after_context
+    if _RE_LEGAL_INDICATOR.search(context):
+        return full_match  # Keep original format for legal references
+
+    # Check if surrounded by Myanmar numerals (likely administrative reference)
+    if _RE_MYANMAR_DIGIT.search(context):
+        return full_match  # Keep original format
+
+    # Check for license plate patterns and file paths: XXX-##/##X-XXXX or similar
+    full_context = before_context + full_match + after_context
+    if _RE_LICENSE_PLATE.search(full_context):
+        return full_match  # Keep original format for license plates
+
+    # Check if it's part of a dash-separated identifier (common in licenses/IDs)
+    if '-' in before_context or '-' in after_context:
+        return full_match  # Keep original format
+
+    # Check for file extensions in the context (indicates file paths)
+    if _RE_FILE_EXTENSION.search(full_context):
+        return full_match  # Keep original format for file paths
+
+    # Check if it's part of a URL or path structure
+    if '/' in before_context or '/' in after_context:
+        # Look for path-like patterns
+        if _RE_PATH_SEGMENT.search(before_context + after_context):
+            return full_match  # Keep original format for paths
+
+    # Check for common time/availability expressions
+    num1, num2 = match.groups()
+    if (num1 == '24' and num2 == '7') or (num1 == '7' and num2 == '24'):
+        return full_match  # Keep 24/7 as is (24 hours, 7 days)
+
+    # Check if surrounded by parentheses (often indicates service hours, not math)
+    if ('(' in before_context and ')' in after_context) or ('（' in before_context and '）' in after_context):
+        # Common service hour patterns
+        service_patterns = [
+            (num1 == '24' and num2 == '7'),  # 24/7
+            (num1 == '12' and num2 == '7'),  # 12/7
+            (num1 == '8' and num2 == '5'),   # 8/5 (8am-5pm, 5 days)
+        ]
+        if any(service_patterns):
+            return full_match  # Keep as service hours
+
+    # Only convert if it looks like a pure mathematical fraction
+    return f'$\\frac{{{num1}}}{{{num2}}}$'
+
+def _convert_equation(match):
+    """Convert a short var = expression to LaTeX unless it looks administrative"""
+    var, equation = match.groups()
+    # Skip if it contains Myanmar characters (likely not a math equation)
+    if _RE_MYANMAR.search(equation):
+        return match.group(0)
+    # Skip if equation is too long (likely not a simple math equation)
+    if len(equation.strip()) > 20:
+        return match.group(0)
+    return f'${var} = {equation.strip()}$'
+
+# Common unwanted elements by tag and attributes
+_UNWANTED_SELECTORS = [soupsieve.compile(selector) for selector in (
+    'script', 'style', 'noscript',  # Scripts and styles
+    '[role="banner"]', '[role="navigation"]', '[role="complementary"]',  # ARIA roles
+    '[data-ad]', '[data-advertisement]',  # Ad-related data attributes
+    '.ad', '.ads', '.advertisement', '.banner', '.promo',  # Common ad classes
+    '.social', '.share', '.sharing', '.social-share',  # Social sharing
+    '.comment', '.comments', '.comment-section',  # Comments
+    '.related', '.related-posts', '.related-articles',  # Related content
+    '.sidebar', '.widget', '.widgets',  # Sidebars and widgets
+    '.navigation', '.nav', '.menu', '.breadcrumb',  # Navigation
+    '.header', '.footer',  # Header and footer
+    '.popup', '.modal', '.overlay',  # Popups and modals
+)]
 
 class DataCleaner:
     def __init__(self, config_file: str = "cleaner.yaml"):
@@ -54,6 +569,8 @@ class DataCleaner:
         self.raw_dir = Path("data/raw")
         self.clean_dir = Path("data/clean")
         self.clean_dir.mkdir(parents=True, exist_ok=True)
+        # Merged per-site configs (with compiled selectors), built once per site
+        self._site_configs = {}
     
     def _load_config(self) -> Dict[str, Any]:
         """Load cleaning rules configuration"""
@@ -65,13 +582,35 @@ class DataCleaner:
             return {}
     
     def _get_site_config(self, site_name: str) -> Dict[str, Any]:
-        """Get configuration for specific site"""
+        """Get configuration for specific site (merged and compiled once, then reused)"""
+        if site_name not in self._site_configs:
+            self._site_configs[site_name] = self._build_site_config(site_name)
+        return self._site_configs[site_name]
+    
+    def _build_site_config(self, site_name: str) -> Dict[str, Any]:
+        """Merge defaults with a site's config and precompile its selectors"""
         defaults = self.config.get('defaults', {})
         site_config = self.config.get('sites', {}).get(site_name, {})
         
         # Merge defaults with site-specific config
         config = defaults.copy()
         config.update(site_config)
+        
+        # Cache a parse-only strainer so documents skip building unrelated DOM nodes
+        config['_strainer'] = build_selector_strainer([
+            config.get('main_text_selector', ''),
+            config.get('feature_image_selector', ''),
+        ])
+        
+        # Cache compiled CSS selectors so they are not re-parsed for every document
+        for key, compiled_key in (('feature_image_selector', '_feature_image_sel'),
+                                  ('main_text_selector', '_main_text_sel')):
+            config[compiled_key] = None
+            if config.get(key):
+                try:
+                    config[compiled_key] = compile_css_selector(config[key])
+                except Exception as e:
+                    logger.warning(f"Invalid {key} '{config[key]}' for {site_name}: {e}")
         return config
     
     def clean_title(self, title: str, removal_keywords: List[str]) -> str:
@@ -83,6 +622,7 @@ class DataCleaner:
         title = self.zawgyi_to_unicode(title)
         
         # 2. Remove keywords
+        # Sequential passes in configured order: a removal can expose or split later keywords
         for keyword in removal_keywords:
             if keyword:
                 title = title.replace(keyword, '')
@@ -90,15 +630,19 @@ class DataCleaner:
         # 3. Clean Unicode control characters and HTML entities
         title = self.clean_unicode_and_html_entities(title)
         
-        # 4. Apply cleaning functions
-        title = self.clean_xinhua_content(title)
-        title = self.clean_references_section(title)
+        # 4. Apply cleaning functions (skipping those that cannot match; whitespace is normalized below)
+        if _RE_XINHUA_HINT.search(title):
+            title = self.clean_xinhua_content(title)
+        if '==' in title:
+            title = self.clean_references_section(title)
         title = self.clean_escaped_quotes(title)
-        title = self.clean_botupload_lines(title)
-        title = self.clean_continuous_dashes(title)
+        if 'botupload' in title.lower():
+            title = self.clean_botupload_lines(title)
+        if '--' in title:
+            title = self.clean_continuous_dashes(title)
         
         # 5. Normalize whitespace
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = _RE_WS.sub(' ', title).strip()
         
         return title
     
@@ -114,13 +658,13 @@ class DataCleaner:
         text = self.zawgyi_to_unicode(text)
         
         # 3. Remove keywords
+        # Sequential passes in configured order: a removal can expose or split later keywords
         for keyword in removal_keywords:
             if keyword:
                 text = text.replace(keyword, '')
         
-        # 4. Remove Zawgyi separators
-        separators = ['ZG ', 'Zawgyi ', 'ZAWGYI', '[Zawgyi]', 'ZawGyi']
-        for sep in separators:
+        # 4. Remove Zawgyi separators (cut at the first separator in priority order that occurs)
+        for sep in _ZAWGYI_SEPARATORS:
             sep_index = text.find(sep)
             if sep_index != -1:
                 text = text[:sep_index]
@@ -162,7 +706,7 @@ class DataCleaner:
             
             # Remove elements by CSS selector (handles compound classes)
             try:
-                elements = soup.select(f'.{class_name}')
+                elements = compile_css_selector(f'.{class_name}').select(soup)
                 for element in elements:
                     element.decompose()
             except Exception:
@@ -171,7 +715,7 @@ class DataCleaner:
             
             # Also try to remove by ID if the class name could be an ID
             try:
-                elements = soup.select(f'#{class_name}')
+                elements = compile_css_selector(f'#{class_name}').select(soup)
                 for element in elements:
                     element.decompose()
             except Exception:
@@ -183,23 +727,9 @@ class DataCleaner:
                 element.decompose()
         
         # Remove common unwanted elements by tag and attributes
-        unwanted_selectors = [
-            'script', 'style', 'noscript',  # Scripts and styles
-            '[role="banner"]', '[role="navigation"]', '[role="complementary"]',  # ARIA roles
-            '[data-ad]', '[data-advertisement]',  # Ad-related data attributes
-            '.ad', '.ads', '.advertisement', '.banner', '.promo',  # Common ad classes
-            '.social', '.share', '.sharing', '.social-share',  # Social sharing
-            '.comment', '.comments', '.comment-section',  # Comments
-            '.related', '.related-posts', '.related-articles',  # Related content
-            '.sidebar', '.widget', '.widgets',  # Sidebars and widgets
-            '.navigation', '.nav', '.menu', '.breadcrumb',  # Navigation
-            '.header', '.footer',  # Header and footer
-            '.popup', '.modal', '.overlay',  # Popups and modals
-        ]
-        
-        for selector in unwanted_selectors:
+        for selector in _UNWANTED_SELECTORS:
             try:
-                elements = soup.select(selector)
+                elements = selector.select(soup)
                 for element in elements:
                     element.decompose()
             except Exception:
@@ -210,8 +740,13 @@ class DataCleaner:
         if not html_content:
             return '', ''
         
+        # Plain text without tags or entities: parsing would only return it stripped
+        if not _RE_NEEDS_PARSER.search(html_content):
+            return '', html_content.strip()
+        
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            strainer = site_config.get('_strainer')
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=strainer)
             
             # Remove unwanted elements by class names first
             removal_classes = site_config.get('removal_classes', [])
@@ -219,9 +754,9 @@ class DataCleaner:
             
             # Extract feature image
             feature_image_url = ''
-            feature_image_selector = site_config.get('feature_image_selector', '')
-            if feature_image_selector:
-                img_element = soup.select_one(feature_image_selector)
+            feature_image_sel = site_config.get('_feature_image_sel')
+            if feature_image_sel is not None:
+                img_element = feature_image_sel.select_one(soup)
                 if img_element:
                     feature_image_url = img_element.get('src', '') or img_element.get('data-src', '')
                     if feature_image_url and base_url:
@@ -229,9 +764,9 @@ class DataCleaner:
             
             # Extract main text
             main_text = ''
-            main_text_selector = site_config.get('main_text_selector', '')
-            if main_text_selector:
-                text_elements = soup.select(main_text_selector)
+            main_text_sel = site_config.get('_main_text_sel')
+            if main_text_sel is not None:
+                text_elements = main_text_sel.select(soup)
                 if text_elements:
                     # Process each text element and preserve image positions
                     text_parts = []
@@ -255,6 +790,11 @@ class DataCleaner:
             
             # If no selector worked, fall back to full text extraction
             if not main_text:
+                if strainer is not None:
+                    # The strained tree only holds the selector roots, so re-parse the full document
+                    soup = BeautifulSoup(html_content, 'lxml')
+                    self.remove_unwanted_elements(soup, removal_classes)
+                
                 # Remove script and style elements
                 for script in soup(["script", "style"]):
                     script.decompose()
@@ -298,8 +838,8 @@ class DataCleaner:
             final_text += f'[IMAGE : {feature_image_url}] ' 
         final_text += cleaned_text
         
-        # Generate MD5 ID
-        md5_id = hashlib.md5(url.encode('utf-8')).hexdigest()
+        # Generate MD5 ID (kept as MD5 so IDs match the scraper's and earlier cleaned output)
+        md5_id = hashlib.md5(url.encode('utf-8'), usedforsecurity=False).hexdigest()
         
         cleaned_item = {
             "id": md5_id,
@@ -311,8 +851,8 @@ class DataCleaner:
         
         return cleaned_item
     
-    def process_file(self, input_file: Path) -> None:
-        """Process a single JSONL file"""
+    def process_file(self, input_file: Path, jobs: int = 1) -> None:
+        """Process a single JSONL file (jobs > 1 cleans chunks of lines in parallel)"""
         site_name = input_file.stem
         site_config = self._get_site_config(site_name)
         
@@ -324,49 +864,99 @@ class DataCleaner:
         seen_ids = set()
         
         try:
-            with open(input_file, 'r', encoding='utf-8') as infile, \
-                 open(output_file, 'w', encoding='utf-8') as outfile:
+            # Lines are kept as UTF-8 bytes end to end; both JSON backends decode bytes directly
+            with open(input_file, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+                 open(output_file, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+                
+                write_buffer = bytearray()
+                pending_lines = 0
+                
+                if jobs > 1:
+                    cleaned_items = self._iter_cleaned_items_parallel(infile, site_name, jobs)
+                else:
+                    cleaned_items = ((item, None) for item in self._iter_cleaned_items(infile, site_config))
                 
-                for line in infile:
-                    line = line.strip()
-                    if line:
-                        try:
-                            raw_item = json.loads(line)
-                            cleaned_item = self.extract_final_output(raw_item, site_config)
-                            
-                            # Remove duplicates by ID
-                            item_id = cleaned_item.get('id')
-                            if item_id in seen_ids:
-                                logger.debug(f"Skipping duplicate ID: {item_id}")
-                                continue
-                            
-                            seen_ids.add(item_id)
-                            
-                            # Validate content quality
-                            if self.validate_content_quality(cleaned_item):
-                                outfile.write(json.dumps(cleaned_item, ensure_ascii=False) + '\n')
-                                processed_count += 1
-                            else:
-                                # Add more detailed logging to understand rejection reasons
-                                text_len = len(cleaned_item.get('text', ''))
-                                title_len = len(cleaned_item.get('title', ''))
-                                title_content = cleaned_item.get('title', '')[:100]  # First 100 chars of title
-                                has_myanmar = self.has_myanmar_characters(cleaned_item.get('text', '')) or self.has_myanmar_characters(cleaned_item.get('title', ''))
-                                word_count = self.count_words_myanmar(cleaned_item.get('text', ''))
-                                logger.debug(f"Rejected item {item_id}: text_len={text_len}, word_count={word_count}, title_len={title_len}, has_myanmar={has_myanmar}")
-                                logger.debug(f"Title content: '{title_content}'")
-                            
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Skipping invalid JSON line: {e}")
-                            continue
+                # Results arrive in input order; accepted is None when not validated yet
+                for cleaned_item, accepted in cleaned_items:
+                    # Remove duplicates by ID
+                    item_id = cleaned_item.get('id')
+                    if item_id in seen_ids:
+                        logger.debug(f"Skipping duplicate ID: {item_id}")
+                        continue
+                    
+                    seen_ids.add(item_id)
+                    
+                    # Validate content quality
+                    if accepted is None:
+                        accepted = self._is_item_accepted(cleaned_item)
+                    if accepted:
+                        write_buffer += dumps_jsonl(cleaned_item)
+                        write_buffer += b'\n'
+                        processed_count += 1
+                        pending_lines += 1
+                        if pending_lines >= WRITE_BATCH_SIZE:
+                            outfile.write(write_buffer)
+                            write_buffer.clear()
+                            pending_lines = 0
+                
+                outfile.write(write_buffer)
             
             logger.info(f"Processed {processed_count} items for {site_name}")
             
         except Exception as e:
             logger.error(f"Error processing {input_file}: {e}")
     
-    def process_all_files(self, site_filter: str = None) -> None:
-        """Process all JSONL files in data/raw directory"""
+    def _iter_cleaned_items(self, lines, site_config: Dict[str, Any]):
+        """Parse and clean JSONL lines, skipping blank and invalid ones"""
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            
+            try:
+                raw_item = loads_jsonl(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping invalid JSON line: {e}")
+                continue
+            
+            yield self.extract_final_output(raw_item, site_config)
+    
+    def _iter_cleaned_items_parallel(self, infile, site_name: str, jobs: int):
+        """Clean chunks of lines in worker processes and yield (item, accepted) in input order"""
+        # Bound the number of chunks in flight so large files are not read into memory at once
+        max_pending = jobs * 2
+        pending = deque()
+        
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_line_worker,
+                                 initargs=(self.config_file, site_name, logging.getLogger().level)) as executor:
+            for chunk in _iter_line_chunks(infile, LINE_CHUNK_SIZE):
+                pending.append(executor.submit(_clean_line_chunk, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            
+            while pending:
+                yield from pending.popleft().result()
+    
+    def _is_item_accepted(self, cleaned_item: Dict[str, Any]) -> bool:
+        """Validate content quality, logging rejection details at debug level"""
+        if self.validate_content_quality(cleaned_item):
+            return True
+        
+        # Add more detailed logging to understand rejection reasons (word counting is expensive)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        
+        item_id = cleaned_item.get('id')
+        text_len = len(cleaned_item.get('text', ''))
+        title_len = len(cleaned_item.get('title', ''))
+        title_content = cleaned_item.get('title', '')[:100]  # First 100 chars of title
+        has_myanmar = self.has_myanmar_characters(cleaned_item.get('text', '')) or self.has_myanmar_characters(cleaned_item.get('title', ''))
+        word_count = self.count_words_myanmar(cleaned_item.get('text', ''))
+        logger.debug(f"Rejected item {item_id}: text_len={text_len}, word_count={word_count}, title_len={title_len}, has_myanmar={has_myanmar}")
+        logger.debug(f"Title content: '{title_content}'")
+        return False
+    
+    def process_all_files(self, site_filter: str = None, jobs: int = 1) -> None:
+        """Process all JSONL files in data/raw directory (jobs > 1 cleans files, or the lines of a single file, in parallel)"""
         jsonl_files = list(self.raw_dir.glob("*.jsonl"))
         
         # Filter by site if specified
@@ -384,8 +974,29 @@ class DataCleaner:
         
         logger.info(f"Found {len(jsonl_files)} files to process")
         
-        for jsonl_file in jsonl_files:
-            self.process_file(jsonl_file)
+        if jobs > 1 and len(jsonl_files) == 1:
+            # A single file can only be parallelized across its lines
+            self.process_file(jsonl_files[0], jobs=jobs)
+        elif jobs > 1:
+            # Each site file is independent and writes its own output, so no locking is needed
+            workers = min(jobs, len(jsonl_files))
+            logger.info(f"Processing files with {workers} worker processes")
+            log_level = logging.getLogger().level
+            # Submit the largest files first so a big site does not start last and leave other workers idle
+            jsonl_files.sort(key=lambda f: f.stat().st_size, reverse=True)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_process_file_worker, self.config_file, jsonl_file, log_level): jsonl_file
+                    for jsonl_file in jsonl_files
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing {futures[future]}: {e}")
+        else:
+            for jsonl_file in jsonl_files:
+                self.process_file(jsonl_file)
         
         logger.info("All files processed successfully")
     
@@ -394,6 +1005,10 @@ class DataCleaner:
         if not MYANMAR_TOOLS_AVAILABLE or not text:
             return text
         
+        # Skip the detector for text without Myanmar block characters (Zawgyi also lives there)
+        if text.isascii() or not _RE_MYANMAR.search(text):
+            return text
+        
         try:
             score = detector.get_zawgyi_probability(text)
             if score > 0.5:
@@ -410,37 +1025,28 @@ class DataCleaner:
     
     def has_myanmar_characters(self, text: str) -> bool:
         """Check if text contains Myanmar/Burmese characters"""
-        if not text:
+        # str.isascii is O(1) (CPython tracks the widest character), so pure-ASCII text skips the scan
+        if not text or text.isascii():
             return False
         
         # Myanmar Unicode range: U+1000-U+109F
-        myanmar_pattern = r'[\u1000-\u109F]'
-        return bool(re.search(myanmar_pattern, text))
+        return _RE_MYANMAR.search(text) is not None
     
     def clean_escaped_quotes(self, text: str) -> str:
         """Remove escaped quotes from text"""
         if not text:
             return text
         
-        # Remove escaped quotes \"
-        text = text.replace('\"', ' ')
-        text = text.replace('\\', ' ')
-        
-        return text
+        # Remove escaped quotes \" (both characters) in a single pass
+        return text.translate(_QUOTE_TRANS)
 
     def clean_botupload_lines(self, text: str) -> str:
         """Remove lines containing 'BotUpload' from text"""
         if not text:
             return text
         
-        # Split text into lines
-        lines = text.split('\n')
-        
-        # Filter out lines containing 'BotUpload' (case insensitive)
-        cleaned_lines = [line for line in lines if 'BotUpload' not in line and 'botupload' not in line.lower()]
-        
-        # Rejoin the lines
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Remove lines containing 'BotUpload' (case insensitive) in a single pass
+        cleaned_text = _RE_BOTUPLOAD_LINE.sub('', text)
         
         return cleaned_text.strip()
 
@@ -451,7 +1057,7 @@ class DataCleaner:
         
         # Use regex to find and remove 2 or more consecutive dashes
         # This pattern matches 2 or more consecutive dash characters
-        cleaned_text = re.sub(r'-{2,}', ' - ', text)
+        cleaned_text = _RE_DASHES.sub(' - ', text)
         
         return cleaned_text.strip()
     
@@ -461,69 +1067,28 @@ class DataCleaner:
             return text
         
         # Remove "————" and everything after it
-        dash_pattern = r'————.*$'
-        text = re.sub(dash_pattern, '', text, flags=re.MULTILINE)
+        text = _RE_XINHUA_DASH.sub('', text)
         
         # Remove (Xinhua) and (ဆင်ဟွာ) with misspellings and author names, especially at the end
         # First remove at the end with optional whitespace/punctuation
-        xinhua_end_patterns = [
-            r'\s*\([Xx][Ii][Nn][Hh][Uu][Aa]/[^)]+\)\s*[.။]*\s*$',  # (Xinhua/Author) at end
-            r'\s*\([Xx][Ii][Nn][Hh].*?\)\s*[.။]*\s*$',  # English (Xinh*) - catches misspellings
-            r'\s*\([Xx][Ii][Nn][Hh][Uu][Aa]\)\s*[.။]*\s*$',  # English (Xinhua) - exact match
-            r'\s*\(ဆင်ဟွာ\)\s*[.။]*\s*$'  # Myanmar (ဆင်ဟွာ)
-        ]
-        
-        for pattern in xinhua_end_patterns:
-            text = re.sub(pattern, '', text)
+        for pattern in _XINHUA_END_RES:
+            text = pattern.sub('', text)
         
         # Then remove any remaining occurrences anywhere in text
-        xinhua_patterns = [
-            r'\([Xx][Ii][Nn][Hh][Uu][Aa]/[^)]+\)',  # (Xinhua/Author) anywhere
-            r'\([Xx][Ii][Nn][Hh].*?\)',  # English (Xinh*) - catches misspellings
-            r'\([Xx][Ii][Nn][Hh][Uu][Aa]\)',  # English (Xinhua) - exact match
-            r'\(ဆင်ဟွာ\)'  # Myanmar (ဆင်ဟွာ)
-        ]
-        
-        for pattern in xinhua_patterns:
-            text = re.sub(pattern, '', text)
+        for pattern in _XINHUA_RES:
+            text = pattern.sub('', text)
         
         # Remove dots separator commonly used in Xinhua articles
-        text = re.sub(r'^…+', '', text, flags=re.MULTILINE)
+        text = _RE_LEADING_ELLIPSIS.sub('', text)
         
         # Find and remove English/Chinese version sections with misspellings
         # Pattern includes non-alphabetic characters before version markers
-        version_patterns = [
-            # English version patterns (with common misspellings)
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ers?i?o?n+(?:\))?.*',
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ersi+on+(?:\))?.*',
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Ee]nglish\s*[Vv]ersion+(?:\))?.*',
-            
-            # Chinese version patterns (with common misspellings)  
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ers?i?o?n+(?:\))?.*',
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ersi+on+(?:\))?.*',
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?[Cc]hinese\s*[Vv]ersion+(?:\))?.*',
-            
-            # Exact case patterns (fallback)
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?English\s*Version(?:\))?.*',
-            r'[^a-zA-Z\u1000-\u109F]*(?:\()?Chinese\s*Version(?:\))?.*'
-        ]
-        
-        for pattern in version_patterns:
+        for pattern in _VERSION_RES:
             # Find the position where version section starts
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 # Find where the actual alphabetic content ends before the version marker
-                before_match = text[:match.start()]
-                
-                # Look for the last alphabetic character or Myanmar character before the match
-                last_alpha_pos = match.start()
-                for i in range(match.start() - 1, -1, -1):
-                    if text[i].isalpha() or '\u1000' <= text[i] <= '\u109F':
-                        last_alpha_pos = i + 1
-                        break
-                    elif i == 0:
-                        last_alpha_pos = 0
-                        break
+                last_alpha_pos = self._last_alpha_end(text, match.start())
                 
                 # Check if there's Myanmar content after the version marker
                 after_version = text[match.end():]
@@ -537,16 +1102,22 @@ class DataCleaner:
         
         return text.strip()
     
+    def _last_alpha_end(self, text: str, end: int) -> int:
+        """Position just after the last alphabetic or Myanmar character in text[:end] (0 if none)"""
+        # Scan back from end: it stops at the first letter, so cost is the length of the non-letter tail
+        for i in range(end - 1, -1, -1):
+            char = text[i]
+            if char.isalpha() or '\u1000' <= char <= '\u109F':
+                return i + 1
+        return 0
+    
     def clean_references_section(self, text: str) -> str:
         """Clean Myanmar references section: == ကိုးကား =="""
         if not text:
             return text
         
-        # Pattern to match "== ကိုးကား ==" with optional whitespace
-        references_pattern = r'\s*==\s*ကိုးကား\s*==\s*'
-        
-        # Find the references section
-        match = re.search(references_pattern, text)
+        # Find the references section ("== ကိုးကား ==" with optional whitespace)
+        match = _RE_REFERENCES.search(text)
         if match:
             # Get the text after the references marker
             after_references = text[match.end():].strip()
@@ -567,68 +1138,18 @@ class DataCleaner:
             return text
         
         # Remove HTML tags completely
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _RE_HTML_TAG.sub('', text)
         
         # Clean Unicode control characters and HTML entities
         text = self.clean_unicode_and_html_entities(text)
         
-        # Remove navigation and menu patterns
-        nav_patterns = [
-            r'(?i)menu\s*[:：]\s*.*?(?=\n|$)',
-            r'(?i)navigation\s*[:：]\s*.*?(?=\n|$)',
-            r'(?i)breadcrumb\s*[:：]\s*.*?(?=\n|$)',
-            r'(?i)home\s*[>›]\s*.*?(?=\n|$)',
-            r'(?i)သင်္ကေတ\s*[:：]\s*.*?(?=\n|$)',  # Myanmar "symbol/menu"
-            r'(?i)မူလစာမျက်နှာ\s*[>›]\s*.*?(?=\n|$)',  # Myanmar "home page"
-        ]
-        
-        for pattern in nav_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
-        
-        # Remove advertisement patterns
-        ad_patterns = [
-            r'(?i)advertisement\s*[:：]?.*?(?=\n|$)',
-            r'(?i)sponsored\s*[:：]?.*?(?=\n|$)',
-            r'(?i)ads?\s*[:：]?.*?(?=\n|$)',
-            r'(?i)ကြော်ငြာ\s*[:：]?.*?(?=\n|$)',  # Myanmar "advertisement"
-            r'(?i)click\s+here.*?(?=\n|$)',
-            r'(?i)read\s+more.*?(?=\n|$)',
-            r'(?i)continue\s+reading.*?(?=\n|$)',
-        ]
-        
-        for pattern in ad_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
-        
-        # Remove copyright and disclaimer patterns
-        legal_patterns = [
-            r'(?i)copyright\s*[©℗]?\s*\d{4}.*?(?=\n|$)',
-            r'(?i)all\s+rights?\s+reserved.*?(?=\n|$)',
-            r'(?i)disclaimer\s*[:：]?.*?(?=\n|$)',
-            r'(?i)terms?\s+of\s+use.*?(?=\n|$)',
-            r'(?i)privacy\s+policy.*?(?=\n|$)',
-            r'(?i)မူပိုင်ခွင့်.*?(?=\n|$)',  # Myanmar "copyright"
-            r'(?i)တရားဝင်.*?(?=\n|$)',  # Myanmar "legal"
-        ]
-        
-        for pattern in legal_patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
+        # Remove navigation, advertisement, copyright and disclaimer patterns
+        for pattern in _LINE_NOISE_RES:
+            text = pattern.sub('', text)
         
         # Remove webpage buttons and interactive elements
-        button_patterns = [
-            r'(?i)\[?\s*share\s*\]?',
-            r'(?i)\[?\s*like\s*\]?',
-            r'(?i)\[?\s*comment\s*\]?',
-            r'(?i)\[?\s*subscribe\s*\]?',
-            r'(?i)\[?\s*follow\s*\]?',
-            r'(?i)\[?\s*tweet\s*\]?',
-            r'(?i)\[?\s*facebook\s*\]?',
-            r'(?i)\[?\s*twitter\s*\]?',
-            r'(?i)\[?\s*download\s*\]?',
-            r'(?i)\[?\s*print\s*\]?',
-        ]
-        
-        for pattern in button_patterns:
-            text = re.sub(pattern, '', text)
+        for pattern in _BUTTON_RES:
+            text = pattern.sub('', text)
         
         return text.strip()
     
@@ -640,72 +1161,18 @@ class DataCleaner:
         # First decode HTML entities
         text = html.unescape(text)
         
-        # Remove Unicode control characters and format characters
-        # U+200E (Left-to-Right Mark), U+200F (Right-to-Left Mark)
-        # U+202A-U+202E (Directional formatting characters)
-        # U+2060 (Word Joiner), U+FEFF (Zero Width No-Break Space/BOM)
-        control_chars = [
-            '\u200E',  # Left-to-Right Mark
-            '\u200F',  # Right-to-Left Mark
-            '\u202A',  # Left-to-Right Embedding
-            '\u202B',  # Right-to-Left Embedding
-            '\u202C',  # Pop Directional Formatting
-            '\u202D',  # Left-to-Right Override
-            '\u202E',  # Right-to-Left Override
-            '\u2060',  # Word Joiner
-            '\uFEFF',  # Zero Width No-Break Space (BOM)
-            '\u00AD',  # Soft Hyphen
-            '\u200B',  # Zero Width Space
-            '\u200C',  # Zero Width Non-Joiner
-            '\u200D',  # Zero Width Joiner
-            '\u2028',  # Line Separator
-            '\u2029',  # Paragraph Separator
-        ]
-        
-        for char in control_chars:
-            text = text.replace(char, '')
+        # Remove Unicode control characters and convert special spaces to regular space
+        text = text.translate(_CONTROL_SPACE_TRANS)
         
         # Remove other Unicode control characters using unicodedata
         text = ''.join(char for char in text if unicodedata.category(char) not in ['Cc', 'Cf', 'Cs', 'Co', 'Cn'])
         
-        # Convert non-breaking space and other special spaces to regular space
-        special_spaces = [
-            '\xa0',    # Non-breaking space
-            '\u2000',  # En quad
-            '\u2001',  # Em quad
-            '\u2002',  # En space
-            '\u2003',  # Em space
-            '\u2004',  # Three-per-em space
-            '\u2005',  # Four-per-em space
-            '\u2006',  # Six-per-em space
-            '\u2007',  # Figure space
-            '\u2008',  # Punctuation space
-            '\u2009',  # Thin space
-            '\u200A',  # Hair space
-            '\u3000',  # Ideographic space
-        ]
-        
-        for space_char in special_spaces:
-            text = text.replace(space_char, ' ')
-        
         # Additional HTML entity cleanup (extended list)
-        html_entities = {
-            '&nbsp;': ' ', '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"',
-            '&apos;': "'", '&copy;': '©', '&reg;': '®', '&trade;': '™',
-            '&#39;': "'", '&#34;': '"', '&#8217;': "'", '&#8220;': '"', '&#8221;': '"',
-            '&#8216;': "'", '&#8218;': "'", '&#8222;': '"', '&#8230;': '...',
-            '&#8211;': '–', '&#8212;': '—', '&#8226;': '•', '&#8482;': '™',
-            '&#169;': '©', '&#174;': '®', '&#8364;': '€', '&#163;': '£',
-            '&#8594;': '→', '&#8592;': '←', '&#8593;': '↑', '&#8595;': '↓',
-            '&mdash;': '—', '&ndash;': '–', '&ldquo;': '"', '&rdquo;': '"',
-            '&lsquo;': "'", '&rsquo;': "'", '&hellip;': '...', '&bull;': '•',
-        }
-        
-        for entity, replacement in html_entities.items():
+        for entity, replacement in _HTML_ENTITIES.items():
             text = text.replace(entity, replacement)
         
         # Remove any remaining HTML entities using regex
-        text = re.sub(r'&#?\w+;', '', text)
+        text = _RE_HTML_ENTITY.sub('', text)
         
         return text
 
@@ -718,48 +1185,25 @@ class DataCleaner:
         text = self.clean_unicode_and_html_entities(text)
         
         # Remove emojis and artistic symbols
-        # Unicode ranges for emojis and symbols
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"  # dingbats
-            "\U000024C2-\U0001F251"  # enclosed characters
-            "\U0001F900-\U0001F9FF"  # supplemental symbols
-            "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-A
-            "]+", flags=re.UNICODE
-        )
-        text = emoji_pattern.sub('', text)
+        text = _RE_EMOJI.sub('', text)
         
         # Remove other special symbols and artistic characters
-        special_symbols = [
-            '★', '☆', '♪', '♫', '♬', '♩', '♭', '♮', '♯',  # stars and music
-            '♠', '♣', '♥', '♦',  # card suits
-            '▲', '▼', '◆', '◇', '○', '●', '□', '■',  # geometric shapes
-            '→', '←', '↑', '↓', '↔', '↕',  # arrows
-            '※', '§', '¶', '†', '‡', '•', '‰', '‱',  # misc symbols
-            '℃', '℉', '°', '′', '″', '‴',  # degree and temperature
-        ]
-        
-        for symbol in special_symbols:
-            text = text.replace(symbol, '')
+        text = text.translate(_SYMBOL_TRANS)
         
         # Normalize line breaks - no more than one consecutive line break
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 line breaks
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Clean up spaced line breaks
+        text = _RE_MULTI_NEWLINE.sub('\n\n', text)  # Max 2 line breaks
+        text = _RE_SPACED_NEWLINES.sub('\n\n', text)  # Clean up spaced line breaks
         
         # Normalize spaces and indentation
         # Remove excessive spaces (more than 2 consecutive spaces)
-        text = re.sub(r' {3,}', '  ', text)
+        text = _RE_LONG_SPACES.sub('  ', text)
         
         # Remove abnormal indentation (tabs and excessive spaces at line start)
-        text = re.sub(r'^\s{4,}', '  ', text, flags=re.MULTILINE)  # Max 2 spaces indent
-        text = re.sub(r'^\t+', '  ', text, flags=re.MULTILINE)  # Replace tabs with 2 spaces
+        text = _RE_DEEP_INDENT.sub('  ', text)  # Max 2 spaces indent
+        text = _RE_TAB_INDENT.sub('  ', text)  # Replace tabs with 2 spaces
         
         # Clean up mixed spaces and tabs
-        text = re.sub(r'[ \t]+', ' ', text)  # Normalize all whitespace to single spaces
+        text = _RE_SPACES_TABS.sub(' ', text)  # Normalize all whitespace to single spaces
         
         return text.strip()
     
@@ -770,155 +1214,25 @@ class DataCleaner:
         
         # Detect and convert simple table patterns
         # Pattern: data separated by | or multiple spaces/tabs
-        table_patterns = [
-            r'(\|[^|\n]+\|[^|\n]*\n)+',  # Pipe-separated tables
-            r'((?:[^\n\t]{2,}\t[^\n\t]{2,}(?:\t[^\n\t]{2,})*\n){2,})',  # Tab-separated tables
-        ]
-        
-        def convert_table_to_latex(match):
-            table_text = match.group(0).strip()
-            lines = table_text.split('\n')
-            
-            if '|' in table_text:
-                # Pipe-separated table
-                rows = []
-                for line in lines:
-                    if '|' in line:
-                        cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-                        if cells:
-                            rows.append(' & '.join(cells) + ' \\\\')
-                
-                if rows:
-                    col_count = len(rows[0].split(' & '))
-                    latex_table = f"\\begin{{tabular}}{{{('c' * col_count)}}}\n"
-                    latex_table += '\n'.join(rows)
-                    latex_table += "\n\\end{tabular}"
-                    return latex_table
-            
-            elif '\t' in table_text:
-                # Tab-separated table
-                rows = []
-                for line in lines:
-                    if '\t' in line:
-                        cells = [cell.strip() for cell in line.split('\t') if cell.strip()]
-                        if cells:
-                            rows.append(' & '.join(cells) + ' \\\\')
-                
-                if rows:
-                    col_count = len(rows[0].split(' & '))
-                    latex_table = f"\\begin{{tabular}}{{{('c' * col_count)}}}\n"
-                    latex_table += '\n'.join(rows)
-                    latex_table += "\n\\end{tabular}"
-                    return latex_table
-            
-            return match.group(0)  # Return original if conversion fails
-        
-        for pattern in table_patterns:
-            text = re.sub(pattern, convert_table_to_latex, text, flags=re.MULTILINE)
+        for pattern, required in _TABLE_RES:
+            if required in text:
+                text = pattern.sub(_convert_table_to_latex, text)
         
         # Convert mathematical expressions to LaTeX (but exclude Myanmar legal/administrative references)
-        # Simple patterns for common mathematical expressions
-        math_patterns = [
-            (r'(\d+)\s*\^\s*(\d+)', r'$\1^{\2}$'),  # Exponents: 2^3 -> $2^{3}$
-            (r'sqrt\(([^)]+)\)', r'$\\sqrt{\1}$'),  # Square root: sqrt(x) -> $\sqrt{x}$
-        ]
-        
         # Only convert fractions that are clearly mathematical (not legal/administrative references)
         # Exclude patterns that contain Myanmar text or legal document patterns
-        def convert_fraction(match):
-            full_match = match.group(0)
-            before_context = text[max(0, match.start()-20):match.start()]
-            after_context = text[match.end():match.end()+20]
-            
-            # Check if this looks like a legal document reference or license plate
-            legal_indicators = [
-                'ပုဒ်မ', 'ကြီး', 'ယာဉ်', 'လိုင်စင်', 'အမှတ်', 'နံပါတ်',  # Myanmar legal terms
-                'section', 'article', 'law', 'act', 'license', 'number',  # English legal terms
-                '(က)', '(ခ)', '(ဂ)', '(ပ)', '(ဖ)', '(ဗ)', '(မ)',  # Myanmar subsection markers
-                'YGN', 'MDY', 'NPT', 'MGW', 'BGA', 'PGO', 'TNU', 'KYT',  # Myanmar city codes
-                'TOYOTA', 'HONDA', 'NISSAN', 'MAZDA', 'HYUNDAI', 'KIA', 'FORD',  # Car brands
-                'BUS', 'TRUCK', 'CAR', 'TAXI', 'VAN', 'MOTORCYCLE',  # Vehicle types
-            ]
-            
-            context = before_context + after_context
-            for indicator in legal_indicators:
-                if indicator in context:
-                    return full_match  # Keep original format for legal references
-            
-            # Check if surrounded by Myanmar numerals (likely administrative reference)
-            if re.search(r'[၀-၉]', before_context + after_context):
-                return full_match  # Keep original format
-            
-            # Check for license plate patterns and file paths: XXX-##/##X-XXXX or similar
-            license_plate_patterns = [
-                r'[A-Z]{2,4}-\d+/\d+[A-Z]?-[A-Z\d]+',  # YGN-40/7N-XXXX
-                r'[A-Z]{2,4}\s*-\s*\d+\s*/\s*\d+',     # YGN-40/7 or YGN - 40/7
-                r'\d+\s*/\s*\d+[A-Z]',                  # 40/7N
-                r'[A-Z]\s*\d+\s*/\s*\d+',              # A40/7
-                r'\w+/\d+/\d+\.\w+',                    # file paths like t33/1/16/2705.png
-                r'\d+/\d+/\d+\.\w+',                    # numeric paths like 33/1/16/2705.png
-                r'[a-zA-Z0-9_-]+/\d+/\d+',             # directory/number/number patterns
-            ]
-            
-            full_context = before_context + full_match + after_context
-            for pattern in license_plate_patterns:
-                if re.search(pattern, full_context):
-                    return full_match  # Keep original format for license plates
-            
-            # Check if it's part of a dash-separated identifier (common in licenses/IDs)
-            if '-' in before_context or '-' in after_context:
-                return full_match  # Keep original format
-            
-            # Check for file extensions in the context (indicates file paths)
-            file_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.bmp', '.pdf', '.doc', '.txt']
-            context_text = before_context + full_match + after_context
-            if any(ext in context_text.lower() for ext in file_extensions):
-                return full_match  # Keep original format for file paths
-            
-            # Check if it's part of a URL or path structure
-            if '/' in before_context or '/' in after_context:
-                # Look for path-like patterns
-                if re.search(r'[a-zA-Z0-9_-]+/', before_context + after_context):
-                    return full_match  # Keep original format for paths
-            
-            # Check for common time/availability expressions
-            num1, num2 = match.groups()
-            if (num1 == '24' and num2 == '7') or (num1 == '7' and num2 == '24'):
-                return full_match  # Keep 24/7 as is (24 hours, 7 days)
-            
-            # Check if surrounded by parentheses (often indicates service hours, not math)
-            if ('(' in before_context and ')' in after_context) or ('（' in before_context and '）' in after_context):
-                # Common service hour patterns
-                service_patterns = [
-                    (num1 == '24' and num2 == '7'),  # 24/7
-                    (num1 == '12' and num2 == '7'),  # 12/7
-                    (num1 == '8' and num2 == '5'),   # 8/5 (8am-5pm, 5 days)
-                ]
-                if any(service_patterns):
-                    return full_match  # Keep as service hours
-            
-            # Only convert if it looks like a pure mathematical fraction
-            return f'$\\frac{{{num1}}}{{{num2}}}$'
-        
         # Apply fraction conversion with context checking
-        text = re.sub(r'(\d+)\s*/\s*(\d+)', convert_fraction, text)
+        if '/' in text:
+            text = _RE_FRACTION.sub(_convert_fraction, text)
         
         # Apply other math patterns
-        for pattern, replacement in math_patterns:
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement, required in _MATH_RES:
+            if required in text:
+                text = pattern.sub(replacement, text)
         
         # Only convert equations that are clearly mathematical (not administrative)
-        def convert_equation(match):
-            var, equation = match.groups()
-            # Skip if it contains Myanmar characters (likely not a math equation)
-            if re.search(r'[\u1000-\u109F]', equation):
-                return match.group(0)
-            # Skip if equation is too long (likely not a simple math equation)
-            if len(equation.strip()) > 20:
-                return match.group(0)
-            return f'${var} = {equation.strip()}$'
-        
-        text = re.sub(r'([a-zA-Z])\s*=\s*([^,\n]+)', convert_equation, text)
+        if '=' in text:
+            text = _RE_EQUATION.sub(_convert_equation, text)
         
         return text
     
@@ -935,30 +1249,25 @@ class DataCleaner:
         ]
         
         # Check for multiple topics (too many topic changes)
-        topic_change_indicators = len(re.findall(r'\n\s*\n', text))
-        if topic_change_indicators > 10:  # Too many paragraph breaks suggest multiple topics
-            return False
+        # Each break consumes at least two newlines, so fewer than 22 can never exceed the limit
+        if text.count('\n') > 21:
+            topic_change_indicators = sum(1 for _ in _RE_PARAGRAPH_BREAK.finditer(text))
+            if topic_change_indicators > 10:  # Too many paragraph breaks suggest multiple topics
+                return False
         
         # Check for garbled text (too many non-standard characters)
         total_chars = len(text)
         if total_chars > 0:
-            # Count Myanmar, English, numbers, and common punctuation
-            valid_chars = len(re.findall(r'[\u1000-\u109F\w\s.,!?;:()"\'-]', text))
+            # Count Myanmar, English, numbers, and common punctuation (as total minus the rare invalid runs)
+            valid_chars = total_chars - sum(map(len, _RE_INVALID_CHARS.findall(text)))
             valid_ratio = valid_chars / total_chars
             
             if valid_ratio < 0.8:  # Less than 80% valid characters suggests garbled text
                 return False
         
         # Check for incoherent characters (random character sequences)
-        incoherent_patterns = [
-            r'[a-zA-Z]{20,}',  # Very long English words (likely garbled)
-            r'[\u1000-\u109F]{30,}',  # Very long Myanmar sequences without spaces
-            r'[0-9]{15,}',  # Very long number sequences
-        ]
-        
-        for pattern in incoherent_patterns:
-            if re.search(pattern, text):
-                return False
+        if _RE_INCOHERENT.search(text):
+            return False
         
         return True
     
@@ -970,8 +1279,8 @@ class DataCleaner:
         # Only check for severely garbled text (much more lenient)
         total_chars = len(text)
         if total_chars > 0:
-            # Count Myanmar, English, numbers, and common punctuation
-            valid_chars = len(re.findall(r'[\u1000-\u109F\w\s.,!?;:()"\'-]', text))
+            # Count Myanmar, English, numbers, and common punctuation (as total minus the rare invalid runs)
+            valid_chars = total_chars - sum(map(len, _RE_INVALID_CHARS.findall(text)))
             valid_ratio = valid_chars / total_chars
             
             # Only reject if less than 50% valid characters (was 80%)
@@ -979,15 +1288,8 @@ class DataCleaner:
                 return False
         
         # Only check for extremely incoherent patterns
-        severe_incoherent_patterns = [
-            r'[a-zA-Z]{50,}',  # Extremely long English words (was 20+)
-            r'[\u1000-\u109F]{100,}',  # Extremely long Myanmar sequences (was 30+)
-            r'[0-9]{30,}',  # Extremely long number sequences (was 15+)
-        ]
-        
-        for pattern in severe_incoherent_patterns:
-            if re.search(pattern, text):
-                return False
+        if _RE_SEVERE_INCOHERENT.search(text):
+            return False
         
         return True
     
@@ -1011,17 +1313,14 @@ class DataCleaner:
                     return myanmar_segmenter.count_words_fast(cleaned_text)
                 else:
                     # For English/other languages, use simple word splitting
-                    words = cleaned_text.split()
-                    return len([w for w in words if w.strip()])
+                    return len(cleaned_text.split())
             except Exception as e:
                 logger.warning(f"Fast Myanmar word counting failed, falling back to simple count: {e}")
                 # Fallback to simple word splitting
-                words = cleaned_text.split()
-                return len([w for w in words if w.strip()])
+                return len(cleaned_text.split())
         else:
             # Fallback to simple word splitting if Myanmar library not available
-            words = cleaned_text.split()
-            return len([w for w in words if w.strip()])
+            return len(cleaned_text.split())
     
     def clean_text_for_counting(self, text: str) -> str:
         """Clean text by removing IMAGE tags, URLs, and other non-countable content"""
@@ -1029,28 +1328,17 @@ class DataCleaner:
             return ""
         
         # Remove IMAGE tags (various formats)
-        # Remove [IMAGE] tags and variations
-        text = re.sub(r'\[IMAGE[^\]]*\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\[IMG[^\]]*\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\[PHOTO[^\]]*\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\[PIC[^\]]*\]', '', text, flags=re.IGNORECASE)
-        
-        # Remove URLs (http, https, www, ftp)
-        url_patterns = [
-            r'https?://[^\s]+',  # http/https URLs
-            r'www\.[^\s]+',      # www URLs
-            r'ftp://[^\s]+',     # ftp URLs
-            r'[^\s]+\.[a-z]{2,}(?:/[^\s]*)?'  # domain.com style URLs
-        ]
+        text = _RE_IMAGE_TAG.sub('', text)
         
-        for pattern in url_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        # Remove URLs (http, https, www, ftp, then domain.com style)
+        text = _RE_PREFIXED_URL.sub('', text)
+        text = _RE_BARE_DOMAIN.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
+        text = _RE_EMAIL.sub('', text)
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WS.sub(' ', text)
         
         return text.strip()
     
@@ -1064,21 +1352,15 @@ class DataCleaner:
         if not text or not title:
             return False
         
-        # Check for Myanmar content (more lenient - either title OR text needs Myanmar)
-        has_myanmar_title = self.has_myanmar_characters(title)
-        has_myanmar_text = self.has_myanmar_characters(text)
-        
-        if not has_myanmar_title and not has_myanmar_text:
-            return False
-        
-        if not text.strip():
-            return False
-        
-        # Check word count using the proper method
+        # Check length first; it is O(1) while the checks below scan the text
         word_count = len(text)
         if word_count < 1000:  # Reduced from 150 to 100 words minimum for better coverage
             return False
         
+        # Check for Myanmar content (more lenient - either title OR text needs Myanmar)
+        if not self.has_myanmar_characters(title) and not self.has_myanmar_characters(text):
+            return False
+        
       
       # Only check for severe content quality issues (more lenient)
         if not self.detect_severe_content_issues(text):
@@ -1087,11 +1369,49 @@ class DataCleaner:
         
         return True
 
+# Number of JSONL lines sent to a worker process at a time when cleaning a single file in parallel
+LINE_CHUNK_SIZE = 256
+
+# Per-process state for line-level workers (set up once by _init_line_worker)
+_worker_cleaner = None
+_worker_site_config = None
+
+def _init_line_worker(config_file: str, site_name: str, log_level: int) -> None:
+    """Build the cleaner and site config once per worker process"""
+    global _worker_cleaner, _worker_site_config
+    logging.getLogger().setLevel(log_level)
+    _worker_cleaner = DataCleaner(config_file)
+    _worker_site_config = _worker_cleaner._get_site_config(site_name)
+
+def _clean_line_chunk(lines: List[bytes]) -> List[Tuple[Dict[str, Any], bool]]:
+    """Clean and validate a chunk of JSONL lines in a worker process"""
+    return [
+        (cleaned_item, _worker_cleaner._is_item_accepted(cleaned_item))
+        for cleaned_item in _worker_cleaner._iter_cleaned_items(lines, _worker_site_config)
+    ]
+
+def _iter_line_chunks(lines, size: int):
+    """Group lines into lists of at most size lines"""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _process_file_worker(config_file: str, input_file: Path, log_level: int) -> None:
+    """Process a single file in a worker process with its own DataCleaner"""
+    logging.getLogger().setLevel(log_level)
+    DataCleaner(config_file).process_file(input_file)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Clean Burmese corpus data')
     parser.add_argument('--site', type=str, help='Process only specific site (e.g., duwun_api, bbc_burmese)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging to see rejection reasons')
+    parser.add_argument('--jobs', '-j', '--workers', type=int, default=1, help='Number of worker processes (files in parallel, or chunks of lines for a single site; 0 = one per CPU core)')
     
     args = parser.parse_args()
     
@@ -1099,8 +1419,10 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     cleaner = DataCleaner()
-    cleaner.process_all_files(site_filter=args.site)
+    cleaner.process_all_files(site_filter=args.site, jobs=jobs)
 
 if __name__ == "__main__":
     main()
@@ -5,18 +5,27 @@ Handles different scraping engines: requests, playwright, selenium
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
+from lxml import etree
+from lxml import html as lxml_html
 import time
 import random
 import logging
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Iterable
 from urllib.robotparser import RobotFileParser
 from urllib.parse import urljoin, urlparse
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Optional imports for headless browsers
 try:
     from playwright.async_api import async_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -32,8 +41,314 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+try:
+    from cssselect import HTMLTranslator, SelectorError
+    CSSSELECT_AVAILABLE = True
+except ImportError:
+    CSSSELECT_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from .utils import normalize_url, extract_domain, is_css_selector
 
+# Pages are handed to lxml as UTF-8 bytes so documents with an XML encoding declaration still parse
+_XPATH_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+@lru_cache(maxsize=64)
+def _compile_xpath(selector: str):
+    """
+    Compile selector as XPath if it really is one, else None
+    
+    is_css_selector only looks for characters like '/' and '@', which CSS attribute selectors
+    (a[href^="/news/"]) contain too; anything soupsieve accepts stays CSS, as it is for the extractor.
+    """
+    if is_css_selector(selector):
+        return None
+    try:
+        soupsieve.compile(selector)
+        return None
+    except soupsieve.SelectorSyntaxError:
+        pass
+    try:
+        return etree.XPath(selector)
+    except etree.XPathSyntaxError:
+        return None
+
+@lru_cache(maxsize=64)
+def _compile_selector(selector: str) -> Tuple[bool, object]:
+    """
+    Classify and compile a selector once
+    
+    Returns (True, XPath) for XPath selectors and for CSS that cssselect can translate, which run
+    on a C-level lxml tree; (False, SoupSieve) for CSS that only soupsieve understands.
+    """
+    xpath = _compile_xpath(selector)
+    if xpath is not None:
+        return True, xpath
+    
+    if CSSSELECT_AVAILABLE:
+        try:
+            return True, etree.XPath(HTMLTranslator().css_to_xpath(selector))
+        except SelectorError:
+            pass
+    
+    return False, soupsieve.compile(selector)
+
+def select_elements(content: str, selector: str) -> List:
+    """
+    Parse content and select elements with a CSS or XPath selector (raises on bad input)
+    
+    Matches are lxml elements, or BeautifulSoup tags for soupsieve-only CSS selectors.
+    """
+    uses_lxml, compiled = _compile_selector(selector)
+    if uses_lxml:
+        tree = lxml_html.fromstring(content.encode('utf-8'), parser=_XPATH_PARSER)
+        return compiled(tree)
+    
+    soup = BeautifulSoup(content, 'lxml')
+    return compiled.select(soup)
+
+@lru_cache(maxsize=64)
+def _css_first_match_xpath(selector: str):
+    """Compile a CSS selector to an XPath that stops at the first match (raises SelectorError)"""
+    return etree.XPath(f"({HTMLTranslator().css_to_xpath(selector)})[1]")
+
+def has_elements(content: str, selector: str) -> bool:
+    """Check whether a CSS or XPath selector matches anything, without collecting every match"""
+    xpath = _compile_xpath(selector)
+    if xpath is None:
+        if not CSSSELECT_AVAILABLE:
+            soup = BeautifulSoup(content, 'lxml')
+            return soup.select_one(selector) is not None
+        
+        try:
+            first_match = _css_first_match_xpath(selector)
+        except SelectorError:
+            # Selectors cssselect can't translate (e.g. soupsieve-only pseudo-classes)
+            soup = BeautifulSoup(content, 'lxml')
+            return soup.select_one(selector) is not None
+        
+        tree = lxml_html.fromstring(content.encode('utf-8'), parser=_XPATH_PARSER)
+        return bool(first_match(tree))
+    
+    tree = lxml_html.fromstring(content.encode('utf-8'), parser=_XPATH_PARSER)
+    return bool(xpath(tree))
+
+# Load more pagination: DOM size probes, and how long to wait for a click to add content
+_JS_NODE_COUNT = "() => document.getElementsByTagName('*').length"
+_JS_NODES_ADDED = "count => document.getElementsByTagName('*').length > count"
+LOAD_MORE_TIMEOUT_MS = 5000
+
+# Resources browser engines skip when block_resources is on; only the HTML is scraped. Stylesheets
+# still load so element visibility (used by load more pagination) stays accurate
+BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font'])
+BLOCKED_URL_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*.mp4', '*.webm', '*.mp3', '*.ogg']
+
+async def _block_resource_route(route):
+    """Playwright route handler that aborts requests for BLOCKED_RESOURCE_TYPES"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# How long fetched robots.txt rules are trusted, and how long a failed fetch is remembered
+ROBOTS_CACHE_TTL = 6 * 60 * 60
+ROBOTS_FAILURE_TTL = 5 * 60
+ROBOTS_MAX_BYTES = 512 * 1024
+
+# How long a page fetched by an engine probe may be reused by the selected engine, in seconds
+LAST_PAGE_TTL = 30
+
+# Transient statuses retried with exponential backoff (urllib3 Retry for requests, by hand for aiohttp)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.3
+RETRY_BACKOFF_CAP = 30.0
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date values are ignored)"""
+    if value and value.strip().isdigit():
+        return float(value.strip())
+    return None
+
+class HostRateLimiter:
+    """
+    Spaces requests per host: each request reserves the host's next free slot, so pacing one site
+    never delays requests to another, and a server's Retry-After pushes that host's slot back
+    """
+    
+    def __init__(self):
+        self._next_slot = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, host: str, interval: float) -> float:
+        """Reserve the host's next slot, interval seconds before the one after it; returns seconds until it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+        return slot - now
+    
+    def wait(self, host: str, interval: float):
+        """Block until a slot for host is free"""
+        wait_time = self.reserve(host, interval)
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    async def acquire(self, host: str, interval: float):
+        """Wait (without blocking the event loop) until a slot for host is free"""
+        wait_time = self.reserve(host, interval)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+    
+    def back_off(self, host: str, seconds: float):
+        """Hold every request to host for at least seconds from now"""
+        with self._lock:
+            self._next_slot[host] = max(self._next_slot.get(host, 0.0), time.monotonic() + seconds)
+
+# Shared by every engine so archive, detail and batch fetches pace each host together
+_HOST_LIMITER = HostRateLimiter()
+
+class _LoopThread:
+    """
+    One persistent event loop on a daemon thread that owns every Playwright object
+    
+    Sync callers hand coroutines to it, so browsers, contexts and pages stay bound to a single
+    loop for the whole crawl no matter which thread calls in. AsyncRequestsEngine runs on it too,
+    so its aiohttp session (and keep-alive connections) outlive a single batch.
+    """
+    
+    loop = None
+    lock = threading.Lock()
+    
+    @classmethod
+    def run(cls, coro):
+        """Run a coroutine on the shared loop (started on first use) and wait for its result"""
+        with cls.lock:
+            if cls.loop is None:
+                cls.loop = asyncio.new_event_loop()
+                threading.Thread(target=cls.loop.run_forever, name='playwright-loop', daemon=True).start()
+        
+        return asyncio.run_coroutine_threadsafe(coro, cls.loop).result()
+
+class _PlaywrightPool:
+    """
+    Browsers shared by every PlaywrightEngine, launched once per headless/visible mode
+    
+    Engines take a fresh context (their own proxy and headers) from a pooled browser and close
+    only that context, so engine probes and the selected engine skip the browser cold start.
+    Playwright objects belong to the event loop that created them; the pool restarts if it is
+    used from a different loop.
+    """
+    
+    LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+    
+    def __init__(self):
+        self.playwright = None
+        self.browsers = {}  # headless flag -> Browser
+        self.loop = None
+    
+    async def get_browser(self, headless: bool = True):
+        """Get the pooled browser for this mode, launching it on first use"""
+        loop = asyncio.get_running_loop()
+        if self.loop is not loop:
+            # Objects from another (possibly closed) loop cannot be reused
+            self.playwright = None
+            self.browsers = {}
+            self.loop = loop
+        
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        
+        browser = self.browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            browser = await self.playwright.chromium.launch(headless=headless, args=self.LAUNCH_ARGS)
+            self.browsers[headless] = browser
+        
+        return browser
+    
+    async def close(self):
+        """Close pooled browsers and stop Playwright"""
+        for browser in self.browsers.values():
+            await browser.close()
+        self.browsers = {}
+        
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+    
+    def shutdown(self):
+        """Sync wrapper for close, run on the loop that owns the browsers"""
+        if self.playwright is None:
+            return
+        
+        _LoopThread.run(self.close())
+
+class _SeleniumPool:
+    """
+    Idle Selenium drivers kept for reuse, keyed by (browser type, headless, resource blocking,
+    proxy, user agent)
+    
+    A driver keeps the proxy and user agent it was launched with, so they are part of the key:
+    an engine only gets a driver launched with the settings it would have used itself.
+    Drivers are recycled after MAX_USES pages.
+    """
+    
+    POOL_SIZE = 4
+    MAX_USES = 50
+    
+    def __init__(self):
+        self.idle = {}  # (browser type, headless, resource blocking, proxy, user agent) -> [driver, ...]
+        self.uses = {}  # id(driver) -> pages loaded
+        self.lock = threading.Lock()
+    
+    def acquire(self, key):
+        """Get an idle driver for key, or None if one has to be launched"""
+        with self.lock:
+            drivers = self.idle.get(key)
+            return drivers.pop() if drivers else None
+    
+    def count_use(self, driver):
+        """Record one page load on a driver"""
+        with self.lock:
+            self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+    
+    def release(self, key, driver):
+        """Return a driver for reuse, or quit it when it is worn out or the pool is full"""
+        with self.lock:
+            drivers = self.idle.setdefault(key, [])
+            if self.uses.get(id(driver), 0) < self.MAX_USES and len(drivers) < self.POOL_SIZE:
+                drivers.append(driver)
+                return
+            self.uses.pop(id(driver), None)
+        
+        driver.quit()
+    
+    def shutdown(self):
+        """Quit every idle driver"""
+        with self.lock:
+            drivers = [driver for pooled in self.idle.values() for driver in pooled]
+            self.idle = {}
+            self.uses = {}
+        
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+_PLAYWRIGHT_POOL = _PlaywrightPool()
+_SELENIUM_POOL = _SeleniumPool()
+
+def shutdown_browser_pools():
+    """Close all pooled Playwright browsers and Selenium drivers"""
+    _PLAYWRIGHT_POOL.shutdown()
+    _SELENIUM_POOL.shutdown()
+
 class ScrapingEngine:
     """Base class for scraping engines"""
     
@@ -42,38 +357,101 @@ class ScrapingEngine:
         self.header_rotator = header_rotator
         self.delay = delay
         self.timeout = timeout
+        self.crawl_delay = None  # Crawl-delay from robots.txt, set by WebCrawler
+        self.crawl_delays = {}  # host -> Crawl-delay for batches spanning several hosts; overrides crawl_delay
         self.logger = logging.getLogger('burmese_scraper.engine')
+        self._last_page = (None, None, 0.0)  # (url, content, fetch time) handed over from the engine probe
+        
+        # User agent robots.txt rules are matched against, picked once rather than per URL
+        self.robots_user_agent = '*'
+        if header_rotator:
+            self.robots_user_agent = header_rotator.generate_headers().get('User-Agent', '*')
+        
+        # Resolve the delay setting once into the (min, max) range to sample, or None for no delay
+        self._delay_range = None
+        if isinstance(delay, tuple) and len(delay) == 2:
+            min_delay, max_delay = delay
+            if max_delay > 0:
+                self._delay_range = (min_delay, max_delay)
+        elif delay > 0:
+            # Backward compatibility for single delay value
+            self._delay_range = (0.5, delay)
     
     def get_page(self, url: str) -> Optional[str]:
         """Get page content - to be implemented by subclasses"""
         raise NotImplementedError
     
-    def find_elements(self, content: str, selector: str) -> List[str]:
-        """Find elements using selector - to be implemented by subclasses"""
-        raise NotImplementedError
+    def set_last_page(self, url: str, content: str, fetched_at: float):
+        """Remember a page fetched elsewhere (the engine probe) so get_page can skip refetching it"""
+        self._last_page = (url, content, fetched_at)
     
-    def add_delay(self):
-        """Add random delay between requests"""
-        if isinstance(self.delay, tuple) and len(self.delay) == 2:
-            min_delay, max_delay = self.delay
-            if max_delay > 0:
-                delay_time = random.uniform(min_delay, max_delay)
-                time.sleep(delay_time)
-        elif self.delay > 0:
-            # Backward compatibility for single delay value
-            delay_time = random.uniform(0.5, self.delay)
-            time.sleep(delay_time)
+    def _get_last_page(self, url: str) -> Optional[str]:
+        """Get the remembered page content if it is for url and still fresh"""
+        last_url, content, fetched_at = self._last_page
+        if url == last_url and time.monotonic() - fetched_at < LAST_PAGE_TTL:
+            return content
+        return None
+    
+    def find_elements(self, content: str, selector: str) -> List:
+        """Find elements using a CSS or XPath selector (shared by every engine)"""
+        try:
+            return select_elements(content, selector)
+        except Exception as e:
+            self.logger.error(f"Error finding elements with selector '{selector}': {e}")
+            return []
+    
+    def get_delay_time(self, host: str = None) -> float:
+        """Pick the random spacing before the next request to a host, at least the site's robots.txt Crawl-delay"""
+        delay_time = random.uniform(*self._delay_range) if self._delay_range else 0
+        
+        crawl_delay = self.crawl_delays.get(host, self.crawl_delay)
+        if crawl_delay:
+            delay_time = max(delay_time, crawl_delay)
+        
+        return delay_time
+    
+    def wait_for_host(self, url: str):
+        """Wait for the url's host to be free, then reserve the slot after get_delay_time()"""
+        host = urlparse(url).netloc
+        _HOST_LIMITER.wait(host, self.get_delay_time(host))
+    
+    async def wait_for_host_async(self, url: str):
+        """wait_for_host for engines running on an event loop"""
+        host = urlparse(url).netloc
+        await _HOST_LIMITER.acquire(host, self.get_delay_time(host))
 
 class RequestsEngine(ScrapingEngine):
     """Requests-based scraping engine"""
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Keep-alive pool sized for bursts against one host, with transient errors retried
+        # (with backoff) by urllib3 instead of failing the page
         self.session = requests.Session()
+        retries = Retry(
+            total=RETRY_ATTEMPTS,
+            backoff_factor=RETRY_BACKOFF_BASE,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False  # Hand the final response back so get_page logs its status
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def cleanup(self):
+        """Release pooled connections"""
+        self.session.close()
     
     def get_page(self, url: str) -> Optional[str]:
         """Get page content using requests"""
+        content = self._get_last_page(url)
+        if content:
+            return content
+        
         try:
+            self.wait_for_host(url)
+            
             # Get headers
             headers = {}
             if self.header_rotator:
@@ -95,40 +473,132 @@ class RequestsEngine(ScrapingEngine):
                 )
             
             if response and response.status_code == 200:
-                self.add_delay()
                 return response.text
             else:
+                if response is not None and response.status_code == 429:
+                    # Retries are exhausted; keep every engine off this host for the server's Retry-After
+                    retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                    if retry_after:
+                        _HOST_LIMITER.back_off(urlparse(url).netloc, retry_after)
                 self.logger.warning(f"Failed to get {url}: {response.status_code if response else 'No response'}")
                 return None
                 
         except Exception as e:
             self.logger.error(f"Error getting {url}: {e}")
             return None
+
+class AsyncRequestsEngine(ScrapingEngine):
+    """aiohttp-based scraping engine that fetches batches of pages concurrently"""
+    
+    def __init__(self, max_concurrency=16, **kwargs):
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency
+        self.session = None  # Kept open across get_pages calls until close()
+    
+    async def setup(self):
+        """Setup aiohttp session (bound to the running event loop)"""
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp not available")
+        
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+    
+    async def cleanup(self):
+        """Cleanup aiohttp session"""
+        try:
+            if self.session:
+                await self.session.close()
+        except Exception as e:
+            self.logger.error(f"Error cleaning up aiohttp session: {e}")
+        finally:
+            self.session = None
     
-    def find_elements(self, content: str, selector: str) -> List[BeautifulSoup]:
-        """Find elements using CSS selector with BeautifulSoup"""
+    async def get_page_async(self, url: str) -> Optional[str]:
+        """Get page content using aiohttp"""
+        next_proxy = None
+        started = time.monotonic()
         try:
-            soup = BeautifulSoup(content, 'html.parser')
+            if not self.session:
+                await self.setup()
             
-            if is_css_selector(selector):
-                elements = soup.select(selector)
-            else:
-                # For XPath, we'll need to use lxml or convert to CSS
-                # For now, treat as CSS and log warning
-                self.logger.warning(f"XPath selector '{selector}' treated as CSS selector")
-                elements = soup.select(selector)
+            # Get headers
+            headers = {}
+            if self.header_rotator:
+                headers = self.header_rotator.generate_headers()
             
-            return elements
+            # Use the next proxy from the rotator if one is configured
+            proxy = None
+            if self.proxy_rotator and hasattr(self.proxy_rotator, 'get_next_proxy'):
+                next_proxy = self.proxy_rotator.get_next_proxy()
+                if next_proxy:
+                    proxy = f'http://{next_proxy}'
+            
+            host = urlparse(url).netloc
+            for attempt in range(RETRY_ATTEMPTS + 1):
+                # Concurrent slots share the host's schedule, so request starts stay a full delay apart;
+                # concurrency overlaps response times and lets different hosts proceed independently
+                await self.wait_for_host_async(url)
+                
+                started = time.monotonic()
+                async with self.session.get(url, headers=headers, proxy=proxy) as response:
+                    if response.status in RETRY_STATUSES and attempt < RETRY_ATTEMPTS:
+                        # Hold the whole host (not just this slot) for the backoff or Retry-After
+                        backoff = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt)
+                        retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                        _HOST_LIMITER.back_off(host, max(backoff, retry_after or 0) + random.uniform(0, RETRY_BACKOFF_BASE))
+                        continue
+                    
+                    if response.status != 200:
+                        self._record_proxy_result(next_proxy, started, False)
+                        self.logger.warning(f"Failed to get {url}: {response.status}")
+                        return None
+                    text = await response.text()
+                    self._record_proxy_result(next_proxy, started, True)
+                    return text
             
         except Exception as e:
-            self.logger.error(f"Error finding elements with selector '{selector}': {e}")
-            return []
+            self._record_proxy_result(next_proxy, started, False)
+            self.logger.error(f"Error getting {url}: {e}")
+            return None
+    
+    def _record_proxy_result(self, proxy, started, ok):
+        """Feed the request's latency and outcome back to a latency-aware proxy rotator"""
+        if proxy and hasattr(self.proxy_rotator, 'record_result'):
+            self.proxy_rotator.record_result(proxy, time.monotonic() - started, ok)
+    
+    async def get_pages_async(self, urls: List[str]) -> List[Optional[str]]:
+        """Get several pages concurrently, at most max_concurrency in flight"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(url):
+            async with semaphore:
+                return await self.get_page_async(url)
+        
+        return await asyncio.gather(*(fetch(url) for url in urls))
+    
+    def get_pages(self, urls: List[str]) -> List[Optional[str]]:
+        """Sync wrapper for get_pages_async; results are in the same order as urls"""
+        return _LoopThread.run(self.get_pages_async(urls))
+    
+    def close(self):
+        """Close the aiohttp session (and its pooled connections)"""
+        if self.session:
+            _LoopThread.run(self.cleanup())
+    
+    def get_page(self, url: str) -> Optional[str]:
+        """Sync wrapper fetching a single page"""
+        return self.get_pages([url])[0]
 
 class PlaywrightEngine(ScrapingEngine):
     """Playwright-based scraping engine"""
     
-    def __init__(self, **kwargs):
+    def __init__(self, block_resources=True, wait_selector=None, **kwargs):
         super().__init__(**kwargs)
+        self.block_resources = block_resources  # Skip images, media and fonts
+        self.wait_selector = wait_selector  # Element that marks a page as loaded (defaults to body)
         self.browser = None
         self.context = None
         self.page = None
@@ -139,15 +609,8 @@ class PlaywrightEngine(ScrapingEngine):
             raise ImportError("Playwright not available")
         
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Browser options - try headless first
-            launch_options = {
-                'headless': True,
-                'args': ['--no-sandbox', '--disable-dev-shm-usage']
-            }
-            
-            self.browser = await self.playwright.chromium.launch(**launch_options)
+            # Pooled browser - try headless first
+            self.browser = await _PLAYWRIGHT_POOL.get_browser(headless=True)
             
             # Context options
             context_options = {}
@@ -159,6 +622,8 @@ class PlaywrightEngine(ScrapingEngine):
                     }
             
             self.context = await self.browser.new_context(**context_options)
+            if self.block_resources:
+                await self.context.route('**/*', _block_resource_route)
             
             # Set headers
             if self.header_rotator:
@@ -172,18 +637,18 @@ class PlaywrightEngine(ScrapingEngine):
             raise
     
     async def cleanup(self):
-        """Cleanup playwright resources"""
+        """Cleanup playwright resources (the pooled browser stays open for reuse)"""
         try:
             if self.page:
                 await self.page.close()
             if self.context:
                 await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
         except Exception as e:
             self.logger.error(f"Error cleaning up Playwright: {e}")
+        finally:
+            self.page = None
+            self.context = None
+            self.browser = None
     
     async def get_page_async(self, url: str) -> Optional[str]:
         """Get page content using Playwright"""
@@ -191,22 +656,11 @@ class PlaywrightEngine(ScrapingEngine):
             if not self.page:
                 await self.setup()
             
-            await self.page.goto(url, timeout=self.timeout * 1000)
-            await self.page.wait_for_load_state('networkidle')
-            
-            content = await self.page.content()
+            await self.wait_for_host_async(url)
+            await self.page.goto(url, timeout=self.timeout * 1000, wait_until='domcontentloaded')
+            await self.wait_for_content()
             
-            # Add delay
-            if isinstance(self.delay, tuple) and len(self.delay) == 2:
-                min_delay, max_delay = self.delay
-                if max_delay > 0:
-                    delay_time = random.uniform(min_delay, max_delay)
-                    await asyncio.sleep(delay_time)
-            elif self.delay > 0:
-                # Backward compatibility for single delay value
-                await asyncio.sleep(random.uniform(0.5, self.delay))
-            
-            return content
+            return await self.page.content()
             
         except Exception as e:
             self.logger.warning(f"Headless Playwright failed for {url}: {e}")
@@ -215,20 +669,12 @@ class PlaywrightEngine(ScrapingEngine):
                 await self.cleanup()
                 await self.setup_visible()
                 
-                await self.page.goto(url, timeout=self.timeout * 1000)
-                await self.page.wait_for_load_state('networkidle')
+                await self.wait_for_host_async(url)
+                await self.page.goto(url, timeout=self.timeout * 1000, wait_until='domcontentloaded')
+                await self.wait_for_content()
                 
                 content = await self.page.content()
                 
-                if isinstance(self.delay, tuple) and len(self.delay) == 2:
-                    min_delay, max_delay = self.delay
-                    if max_delay > 0:
-                        delay_time = random.uniform(min_delay, max_delay)
-                        await asyncio.sleep(delay_time)
-                elif self.delay > 0:
-                    # Backward compatibility for single delay value
-                    await asyncio.sleep(random.uniform(0.5, self.delay))
-                
                 self.logger.info(f"Visible browser succeeded for {url}")
                 return content
                 
@@ -239,15 +685,8 @@ class PlaywrightEngine(ScrapingEngine):
     async def setup_visible(self):
         """Setup playwright browser in visible mode"""
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Browser options - visible mode
-            launch_options = {
-                'headless': False,
-                'args': ['--no-sandbox', '--disable-dev-shm-usage']
-            }
-            
-            self.browser = await self.playwright.chromium.launch(**launch_options)
+            # Pooled browser - visible mode
+            self.browser = await _PLAYWRIGHT_POOL.get_browser(headless=False)
             
             # Context options
             context_options = {}
@@ -259,6 +698,8 @@ class PlaywrightEngine(ScrapingEngine):
                     }
             
             self.context = await self.browser.new_context(**context_options)
+            if self.block_resources:
+                await self.context.route('**/*', _block_resource_route)
             
             # Set headers
             if self.header_rotator:
@@ -271,46 +712,58 @@ class PlaywrightEngine(ScrapingEngine):
             self.logger.error(f"Error setting up visible Playwright: {e}")
             raise
     
-    def get_page(self, url: str) -> Optional[str]:
-        """Sync wrapper for get_page_async"""
+    async def wait_for_content(self):
+        """Wait until wait_selector is in the DOM, rather than for the network to go idle"""
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.get_page_async(url))
+            await self.page.wait_for_selector(
+                self.wait_selector or 'body', state='attached', timeout=self.timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            # Return whatever loaded; the caller reports a missing selector
+            self.logger.debug(f"Selector '{self.wait_selector}' not found before timeout")
     
-    def find_elements(self, content: str, selector: str) -> List[BeautifulSoup]:
-        """Find elements using BeautifulSoup (same as requests engine)"""
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            if is_css_selector(selector):
-                elements = soup.select(selector)
-            else:
-                self.logger.warning(f"XPath selector '{selector}' treated as CSS selector")
-                elements = soup.select(selector)
-            
-            return elements
-            
-        except Exception as e:
-            self.logger.error(f"Error finding elements with selector '{selector}': {e}")
-            return []
+    def get_page(self, url: str) -> Optional[str]:
+        """Sync wrapper for get_page_async, run on the shared Playwright loop"""
+        return _LoopThread.run(self.get_page_async(url))
 
 class SeleniumEngine(ScrapingEngine):
     """Selenium-based scraping engine"""
     
-    def __init__(self, browser='chrome', **kwargs):
+    def __init__(self, browser='chrome', block_resources=True, **kwargs):
         super().__init__(**kwargs)
         self.browser_type = browser
+        self.block_resources = block_resources  # Skip images, media and fonts
         self.driver = None
+        self.driver_key = None  # Pool key of the current driver
+    
+    def _launch_settings(self):
+        """Proxy and user agent for this engine's driver (None, None for Firefox, which takes neither)"""
+        if self.browser_type.lower() != 'chrome':
+            return None, None
+        
+        proxy = None
+        if self.proxy_rotator and hasattr(self.proxy_rotator, 'get_next_proxy'):
+            proxy = self.proxy_rotator.get_next_proxy()
+        
+        user_agent = None
+        if self.header_rotator:
+            user_agent = self.header_rotator.generate_headers().get('User-Agent')
+        
+        return proxy, user_agent
     
     def setup(self):
         """Setup selenium webdriver"""
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium not available")
         
+        # Reuse an idle pooled driver when there is one
+        proxy, user_agent = self._launch_settings()
+        self.driver_key = (self.browser_type.lower(), True, self.block_resources, proxy, user_agent)
+        self.driver = _SELENIUM_POOL.acquire(self.driver_key)
+        if self.driver:
+            self.driver.set_page_load_timeout(self.timeout)
+            return
+        
         try:
             if self.browser_type.lower() == 'chrome':
                 options = ChromeOptions()
@@ -319,23 +772,27 @@ class SeleniumEngine(ScrapingEngine):
                 options.add_argument('--disable-dev-shm-usage')
                 options.add_argument('--disable-gpu')
                 
-                # Add proxy if available
-                if self.proxy_rotator and hasattr(self.proxy_rotator, 'get_next_proxy'):
-                    proxy = self.proxy_rotator.get_next_proxy()
-                    if proxy:
-                        options.add_argument(f'--proxy-server=http://{proxy}')
+                # Add proxy and user agent if available
+                if proxy:
+                    options.add_argument(f'--proxy-server=http://{proxy}')
+                if user_agent:
+                    options.add_argument(f'--user-agent={user_agent}')
                 
-                # Add user agent if available
-                if self.header_rotator:
-                    headers = self.header_rotator.generate_headers()
-                    if 'User-Agent' in headers:
-                        options.add_argument(f'--user-agent={headers["User-Agent"]}')
+                if self.block_resources:
+                    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
                 
                 self.driver = webdriver.Chrome(options=options)
                 
+                if self.block_resources:
+                    # Fonts and media have no content setting; block them through DevTools
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+                
             elif self.browser_type.lower() == 'firefox':
                 options = FirefoxOptions()
                 options.add_argument('--headless')
+                if self.block_resources:
+                    options.set_preference('permissions.default.image', 2)
                 
                 self.driver = webdriver.Firefox(options=options)
             
@@ -349,19 +806,26 @@ class SeleniumEngine(ScrapingEngine):
             raise
     
     def cleanup(self):
-        """Cleanup selenium resources"""
+        """Cleanup selenium resources (the driver goes back to the pool for reuse)"""
         try:
             if self.driver:
-                self.driver.quit()
+                _SELENIUM_POOL.release(self.driver_key, self.driver)
         except Exception as e:
             self.logger.error(f"Error cleaning up Selenium: {e}")
+        finally:
+            self.driver = None
     
     def get_page(self, url: str) -> Optional[str]:
         """Get page content using Selenium"""
+        content = self._get_last_page(url)
+        if content:
+            return content
+        
         try:
             if not self.driver:
                 self.setup()
             
+            self.wait_for_host(url)
             self.driver.get(url)
             
             # Wait for page to load
@@ -370,7 +834,7 @@ class SeleniumEngine(ScrapingEngine):
             )
             
             content = self.driver.page_source
-            self.add_delay()
+            _SELENIUM_POOL.count_use(self.driver)
             
             return content
             
@@ -381,6 +845,7 @@ class SeleniumEngine(ScrapingEngine):
                 self.cleanup()
                 self.setup_visible()
                 
+                self.wait_for_host(url)
                 self.driver.get(url)
                 
                 WebDriverWait(self.driver, 10).until(
@@ -388,7 +853,7 @@ class SeleniumEngine(ScrapingEngine):
                 )
                 
                 content = self.driver.page_source
-                self.add_delay()
+                _SELENIUM_POOL.count_use(self.driver)
                 
                 self.logger.info(f"Visible Selenium succeeded for {url}")
                 return content
@@ -402,6 +867,14 @@ class SeleniumEngine(ScrapingEngine):
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium not available")
         
+        # Reuse an idle pooled driver when there is one
+        proxy, user_agent = self._launch_settings()
+        self.driver_key = (self.browser_type.lower(), False, self.block_resources, proxy, user_agent)
+        self.driver = _SELENIUM_POOL.acquire(self.driver_key)
+        if self.driver:
+            self.driver.set_page_load_timeout(self.timeout)
+            return
+        
         try:
             if self.browser_type.lower() == 'chrome':
                 options = ChromeOptions()
@@ -410,23 +883,27 @@ class SeleniumEngine(ScrapingEngine):
                 options.add_argument('--disable-dev-shm-usage')
                 options.add_argument('--disable-gpu')
                 
-                # Add proxy if available
-                if self.proxy_rotator and hasattr(self.proxy_rotator, 'get_next_proxy'):
-                    proxy = self.proxy_rotator.get_next_proxy()
-                    if proxy:
-                        options.add_argument(f'--proxy-server=http://{proxy}')
+                # Add proxy and user agent if available
+                if proxy:
+                    options.add_argument(f'--proxy-server=http://{proxy}')
+                if user_agent:
+                    options.add_argument(f'--user-agent={user_agent}')
                 
-                # Add user agent if available
-                if self.header_rotator:
-                    headers = self.header_rotator.generate_headers()
-                    if 'User-Agent' in headers:
-                        options.add_argument(f'--user-agent={headers["User-Agent"]}')
+                if self.block_resources:
+                    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
                 
                 self.driver = webdriver.Chrome(options=options)
                 
+                if self.block_resources:
+                    # Fonts and media have no content setting; block them through DevTools
+                    self.driver.execute_cdp_cmd('Network.enable', {})
+                    self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+                
             elif self.browser_type.lower() == 'firefox':
                 options = FirefoxOptions()
                 # Remove headless option for visible mode
+                if self.block_resources:
+                    options.set_preference('permissions.default.image', 2)
                 
                 self.driver = webdriver.Firefox(options=options)
             
@@ -438,23 +915,6 @@ class SeleniumEngine(ScrapingEngine):
         except Exception as e:
             self.logger.error(f"Error setting up visible Selenium: {e}")
             raise
-    
-    def find_elements(self, content: str, selector: str) -> List[BeautifulSoup]:
-        """Find elements using BeautifulSoup (same as other engines)"""
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            if is_css_selector(selector):
-                elements = soup.select(selector)
-            else:
-                self.logger.warning(f"XPath selector '{selector}' treated as CSS selector")
-                elements = soup.select(selector)
-            
-            return elements
-            
-        except Exception as e:
-            self.logger.error(f"Error finding elements with selector '{selector}': {e}")
-            return []
 
 class WebCrawler:
     """Main web crawler that manages different engines"""
@@ -469,31 +929,143 @@ class WebCrawler:
         self.logger = logging.getLogger('burmese_scraper.crawler')
         
         self.current_engine = None
-        self.robots_cache = {}
+        self.robots_cache = {}  # domain -> (RobotFileParser or None if the fetch failed, fetch time)
+        self._crawl_delays = {}  # (id(parser), user agent) -> (parser, Crawl-delay); holds the parser so ids stay unique
+        
+        # Pooled session for robots.txt fetches, so each domain reuses its keep-alive connection
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        self._probe_cache = {}  # (engine_class, url) -> (content, error) from engine probes
+        self._probe_fetched_at = {}  # (engine_class, url) -> when a successful probe fetched it
+        self._async_engine = None  # AsyncRequestsEngine reused by get_pages_batch, see cleanup()
     
-    def check_robots_txt(self, url: str, user_agent: str = '*') -> bool:
-        """Check if URL is allowed by robots.txt"""
+    def check_robots_txt(self, url: str, user_agent: str = None) -> bool:
+        """Check if URL is allowed by robots.txt (for the current engine's user agent by default)"""
         if not self.respect_robots:
             return True
         
-        try:
-            domain = extract_domain(url)
-            
-            if domain not in self.robots_cache:
-                robots_url = f"http://{domain}/robots.txt"
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                rp.read()
-                self.robots_cache[domain] = rp
-            
-            return self.robots_cache[domain].can_fetch(user_agent, url)
-            
-        except Exception as e:
-            self.logger.warning(f"Error checking robots.txt for {url}: {e}")
+        rp = self._get_robots(extract_domain(url))
+        if rp is None:
             return True  # Allow by default if can't check
+        
+        return rp.can_fetch(user_agent or self._robots_user_agent(), url)
+    
+    def _robots_user_agent(self) -> str:
+        """User agent of the current engine for robots.txt matching"""
+        if self.current_engine:
+            return self.current_engine.robots_user_agent
+        return '*'
+    
+    def prefetch_robots(self, urls: Iterable[str]):
+        """Fetch robots.txt for every not-yet-cached domain in urls concurrently"""
+        if not self.respect_robots:
+            return
+        
+        domains = {extract_domain(url) for url in urls}
+        domains = [domain for domain in domains if not self._is_robots_fresh(domain)]
+        
+        if not domains:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(domains))) as executor:
+            list(executor.map(self._get_robots, domains))
+    
+    def get_crawl_delay(self, url: str, user_agent: str = None) -> Optional[float]:
+        """Get the robots.txt Crawl-delay for the URL's domain, if it sets one"""
+        if not self.respect_robots:
+            return None
+        
+        rp = self._get_robots(extract_domain(url))
+        if rp is None:
+            return None
+        
+        # Looked up once per parsed robots.txt and user agent, not per URL
+        user_agent = user_agent or self._robots_user_agent()
+        cache_key = (id(rp), user_agent)
+        if cache_key not in self._crawl_delays:
+            self._crawl_delays[cache_key] = (rp, rp.crawl_delay(user_agent))
+        return self._crawl_delays[cache_key][1]
+    
+    def _get_robots(self, domain: str) -> Optional[RobotFileParser]:
+        """
+        Get the parsed robots.txt for a domain, re-fetching it once its cache entry expires
+        
+        Failed fetches are cached as None for a short TTL, so an unreachable robots.txt is not
+        re-requested for every URL on that domain.
+        """
+        if self._is_robots_fresh(domain):
+            return self.robots_cache[domain][0]
+        
+        now = time.monotonic()
+        rp = None
+        for scheme in ('https', 'http'):
+            try:
+                rp = self._fetch_robots(f"{scheme}://{domain}/robots.txt")
+                break
+            except Exception as e:
+                self.logger.warning(f"Error fetching robots.txt for {domain} over {scheme}: {e}")
+        
+        self.robots_cache[domain] = (rp, now)
+        return rp
+    
+    def _is_robots_fresh(self, domain: str) -> bool:
+        """Check whether the domain's cached robots.txt entry is still within its TTL"""
+        cached = self.robots_cache.get(domain)
+        if not cached:
+            return False
+        
+        rp, fetched_at = cached
+        ttl = ROBOTS_CACHE_TTL if rp is not None else ROBOTS_FAILURE_TTL
+        return time.monotonic() - fetched_at < ttl
+    
+    def _fetch_robots(self, robots_url: str) -> RobotFileParser:
+        """Fetch and parse one robots.txt over the pooled session (raises if it can't be read)"""
+        headers = self.header_rotator.generate_headers() if self.header_rotator else {}
+        
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+        
+        with self._http.get(robots_url, headers=headers, timeout=5, stream=True) as response:
+            # Same status handling as RobotFileParser.read
+            if response.status_code in (401, 403):
+                rp.disallow_all = True
+            elif 400 <= response.status_code < 500:
+                rp.allow_all = True
+            elif response.status_code != 200:
+                response.raise_for_status()
+                raise requests.HTTPError(f"Unexpected status {response.status_code}")
+            else:
+                # Only the first 512 KB of rules are read (the limit Google applies)
+                body = response.raw.read(ROBOTS_MAX_BYTES, decode_content=True)
+                rp.parse(body.decode('utf-8', errors='replace').splitlines())
+        
+        return rp
     
     def test_engine(self, engine_class, url: str, selector: str) -> Tuple[bool, Optional[str]]:
         """Test if an engine can successfully scrape the given URL and selector"""
+        content, error = self._fetch_for_probe(engine_class, url)
+        if not content:
+            return False, error
+        
+        return self._test_selector(content, selector)
+    
+    def _fetch_for_probe(self, engine_class, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch a page with a throwaway engine for probing, cached per (engine_class, url)
+        
+        Archive and detail engine selection probe the same engines, often on the same URL,
+        so each engine/URL pair is only fetched once per crawler.
+        
+        Returns:
+            (content, None) on success or (None, error message) on failure
+        """
+        cache_key = (engine_class, url)
+        if cache_key in self._probe_cache:
+            return self._probe_cache[cache_key]
+        
+        engine = None
         try:
             engine = engine_class(
                 proxy_rotator=self.proxy_rotator,
@@ -504,22 +1076,51 @@ class WebCrawler:
             
             # Get page content
             content = engine.get_page(url)
-            if not content:
-                return False, "Failed to get page content"
-            
-            # Test selector
-            elements = engine.find_elements(content, selector)
-            if not elements:
-                return False, f"No elements found with selector '{selector}'"
-            
-            # Cleanup if needed
-            if hasattr(engine, 'cleanup'):
-                engine.cleanup()
-            
-            return True, f"Found {len(elements)} elements"
+            result = (content, None) if content else (None, "Failed to get page content")
+            if content:
+                self._probe_fetched_at[cache_key] = time.monotonic()
             
+        except Exception as e:
+            result = (None, str(e))
+        
+        finally:
+            # Cleanup if needed (Playwright's cleanup is a coroutine)
+            if engine is not None and hasattr(engine, 'cleanup'):
+                try:
+                    cleanup_result = engine.cleanup()
+                    if asyncio.iscoroutine(cleanup_result):
+                        _LoopThread.run(cleanup_result)
+                except Exception as e:
+                    self.logger.warning(f"Error cleaning up probe engine: {e}")
+        
+        self._probe_cache[cache_key] = result
+        return result
+    
+    def _hand_over_probe_page(self, engine: ScrapingEngine, engine_class, url: str):
+        """
+        Give a newly selected engine the page its probe just fetched
+        
+        The scraper's first request is usually that same URL. Playwright is left out: load more
+        pagination needs its page to have really navigated there.
+        """
+        if isinstance(engine, PlaywrightEngine):
+            return
+        
+        content, _ = self._probe_cache.get((engine_class, url), (None, None))
+        if content:
+            engine.set_last_page(url, content, self._probe_fetched_at[(engine_class, url)])
+    
+    def _test_selector(self, content: str, selector: str) -> Tuple[bool, Optional[str]]:
+        """Test a selector against already-fetched page content"""
+        try:
+            found = has_elements(content, selector)
         except Exception as e:
             return False, str(e)
+        
+        if not found:
+            return False, f"No elements found with selector '{selector}'"
+        
+        return True, "Found matching elements"
     
     def choose_engine(self, archive_url: str, archive_selector: str, 
                      content_selector: str, force_engine: str = None) -> Optional[ScrapingEngine]:
@@ -543,6 +1144,8 @@ class WebCrawler:
                     delay=self.delay,
                     timeout=self.timeout
                 )
+                if isinstance(engine, PlaywrightEngine):
+                    engine.wait_selector = archive_selector
                 self.logger.info(f"Using forced engine: {force_engine}")
                 return engine
             except Exception as e:
@@ -577,6 +1180,9 @@ class WebCrawler:
                     delay=self.delay,
                     timeout=self.timeout
                 )
+                if isinstance(engine, PlaywrightEngine):
+                    engine.wait_selector = archive_selector
+                self._hand_over_probe_page(engine, engine_class, archive_url)
                 self.logger.info(f"Selected {engine_name} engine for archive")
                 return engine
             except Exception as e:
@@ -608,6 +1214,8 @@ class WebCrawler:
                     delay=self.delay,
                     timeout=self.timeout
                 )
+                if isinstance(engine, PlaywrightEngine):
+                    engine.wait_selector = content_selector
                 self.logger.info(f"Using forced engine for detail pages: {force_engine}")
                 return engine
             except Exception as e:
@@ -642,6 +1250,9 @@ class WebCrawler:
                     delay=self.delay,
                     timeout=self.timeout
                 )
+                if isinstance(engine, PlaywrightEngine):
+                    engine.wait_selector = content_selector
+                self._hand_over_probe_page(engine, engine_class, sample_url)
                 self.logger.info(f"Selected {engine_name} engine for detail pages")
                 return engine
             except Exception as e:
@@ -661,8 +1272,51 @@ class WebCrawler:
         #     self.logger.warning(f"Robots.txt disallows access to {url}")
         #     return None
         
+        # Honor the site's Crawl-delay (robots.txt is fetched once per domain per TTL)
+        if self.respect_robots:
+            self.current_engine.crawl_delay = self.get_crawl_delay(url)
+        
         return self.current_engine.get_page(url)
     
+    def get_pages_batch(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Get content for several pages, concurrently when possible
+        
+        Pages are fetched with AsyncRequestsEngine when aiohttp is installed and the current
+        engine is the plain requests engine; browser engines need rendering, so they (and
+        installs without aiohttp) fall back to fetching one page at a time.
+        
+        Returns:
+            Page contents (None for failures) in the same order as urls
+        """
+        if not self.current_engine:
+            self.logger.error("No engine selected")
+            return [None] * len(urls)
+        
+        if not urls:
+            return []
+        
+        if AIOHTTP_AVAILABLE and type(self.current_engine) is RequestsEngine:
+            # One engine (and aiohttp session) for every batch, so connections to the host are reused
+            if self._async_engine is None:
+                self._async_engine = AsyncRequestsEngine(
+                    proxy_rotator=self.proxy_rotator,
+                    header_rotator=self.header_rotator,
+                    delay=self.delay,
+                    timeout=self.timeout
+                )
+            # A batch can mix hosts, so each host is spaced by its own robots.txt Crawl-delay
+            if self.respect_robots:
+                crawl_delays = {}
+                for url in urls:
+                    host = urlparse(url).netloc
+                    if host not in crawl_delays:
+                        crawl_delays[host] = self.get_crawl_delay(url, self._async_engine.robots_user_agent)
+                self._async_engine.crawl_delays = crawl_delays
+            return self._async_engine.get_pages(urls)
+        
+        return [self.get_page_content(url) for url in urls]
+    
     def get_page_with_pagination(self, url: str, button_selector: str, max_pages: int) -> Optional[str]:
         """Get page content with load more button pagination"""
         if not self.current_engine:
@@ -685,43 +1339,38 @@ class WebCrawler:
                 # Make sure we're on the right page
                 current_url = page.url
                 if current_url != url:
-                    await page.goto(url, timeout=self.timeout * 1000)
-                    await page.wait_for_load_state('networkidle')
+                    await page.goto(url, timeout=self.timeout * 1000, wait_until='domcontentloaded')
+                    await self.current_engine.wait_for_content()
                 
                 clicks_performed = 0
                 max_clicks = max_pages - 1 if max_pages else 10  # Default to 10 clicks
                 
+                # Resolved by Playwright's selector engine on each use; no per-click JS to build
+                button = page.locator(button_selector).first
+                
                 # Simple load more button clicking loop
                 while clicks_performed < max_clicks:
                     try:
-                        # Check if load more button exists
-                        button_exists = await page.evaluate(f"""
-                            () => {{
-                                const btn = document.querySelector("{button_selector}");
-                                return btn !== null && btn.offsetParent !== null;
-                            }}
-                        """)
-                        
-                        if not button_exists:
+                        # Check if load more button exists and is visible
+                        if not await button.is_visible():
                             self.logger.info(f"No more load more button found after {clicks_performed} button clicks")
                             break
                         
                         self.logger.info(f"Clicking load more button ({clicks_performed + 1})")
                         
-                        # Click the button
-                        await page.evaluate(f"""
-                            () => {{
-                                const btn = document.querySelector("{button_selector}");
-                                if (btn) {{
-                                    btn.click();
-                                }}
-                            }}
-                        """)
+                        # Click the button (a DOM click event, like btn.click(), so overlays can't intercept it)
+                        node_count = await page.evaluate(_JS_NODE_COUNT)
+                        await button.dispatch_event('click')
                         
                         clicks_performed += 1
                         
-                        # Wait 1 second as requested
-                        await page.wait_for_timeout(1000)
+                        # Wait until new content lands instead of a fixed 1 second sleep
+                        try:
+                            await page.wait_for_function(
+                                _JS_NODES_ADDED, arg=node_count, polling=100, timeout=LOAD_MORE_TIMEOUT_MS
+                            )
+                        except PlaywrightTimeoutError:
+                            self.logger.debug("No new content appeared after load more click")
                         
                     except Exception as e:
                         self.logger.warning(f"Error clicking load more button: {e}")
@@ -732,20 +1381,8 @@ class WebCrawler:
                 # Get final content
                 return await page.content()
             
-            # Run the async function using existing event loop
-            try:
-                # Try to get existing event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # If loop is already running, we need to use a different approach
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    return loop.run_until_complete(load_more_pagination())
-                else:
-                    return loop.run_until_complete(load_more_pagination())
-            except RuntimeError:
-                # No event loop exists, create a new one
-                return asyncio.run(load_more_pagination())
+            # Run on the loop that owns the engine's page
+            return _LoopThread.run(load_more_pagination())
                 
         except Exception as e:
             self.logger.error(f"Error during load more pagination: {e}")
@@ -760,6 +1397,18 @@ class WebCrawler:
         return self.current_engine.find_elements(content, selector)
     
     def cleanup(self):
-        """Cleanup current engine"""
+        """Cleanup current engine and close pooled browsers"""
         if self.current_engine and hasattr(self.current_engine, 'cleanup'):
-            self.current_engine.cleanup()
+            try:
+                cleanup_result = self.current_engine.cleanup()
+                if asyncio.iscoroutine(cleanup_result):
+                    # Playwright's cleanup must run on the loop that owns its page
+                    _LoopThread.run(cleanup_result)
+            except Exception as e:
+                self.logger.warning(f"Error cleaning up engine: {e}")
+        
+        if self._async_engine:
+            self._async_engine.close()
+            self._async_engine = None
+        
+        shutdown_browser_pools()
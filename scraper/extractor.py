@@ -5,27 +5,203 @@ Handles extraction of article data from HTML content
 """
 
 import re
+import copy
 import logging
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Union
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve
 from datetime import datetime
 
-from .utils import generate_id, normalize_url, clean_text, get_current_timestamp
+from .utils import generate_id, normalize_url, clean_text, get_current_timestamp, is_css_selector
+
+# Build trees with the C lxml parser when available (pure-Python html.parser otherwise)
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Archive pages are selected on a plain lxml tree with cssselect-compiled XPath when both are installed
+try:
+    from lxml import etree
+    import lxml.html as lxml_html
+    from cssselect import HTMLTranslator, SelectorError
+    LXML_SELECT_AVAILABLE = True
+    _LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+except ImportError:
+    LXML_SELECT_AVAILABLE = False
+
+# Optional selectolax (lexbor) parser for the fast archive path
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# One shared dateutil parser instead of importing per call
+try:
+    from dateutil.parser import parser as DateParser
+    _DATE_PARSER = DateParser()
+except ImportError:
+    _DATE_PARSER = None
+
+# Simple date heuristics, joined into one pattern
+_DATE_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}'   # YYYY-MM-DD
+    r'|\d{2}/\d{2}/\d{4}'  # MM/DD/YYYY
+    r'|\d{2}-\d{2}-\d{4}'  # MM-DD-YYYY
+    r'|\w+ \d{1,2}, \d{4}' # Month DD, YYYY
+)
+
+# Fixed selectors, compiled once at import
+_ARCHIVE_TITLE_SELECTOR_STRINGS = ('h1', 'h2', 'h3', '.title', '.headline', '.post-title', '.article-title')
+_ARCHIVE_TITLE_SELECTORS = [soupsieve.compile(selector) for selector in _ARCHIVE_TITLE_SELECTOR_STRINGS]
+_TITLE_CANDIDATES = soupsieve.compile(
+    'title, meta[property="og:title"], meta[name="twitter:title"], h1, h2'
+)
+
+# Thumbnail URL attributes in order of preference (first non-empty wins)
+_THUMBNAIL_ATTRS = ('src', 'data-src', 'data-lazy-src', 'data-original', 'data-lazy')
+
+# Date/author sources in priority order; each list is also joined into one selector so the
+# document is walked once, then the matches are ranked back into this order
+_DATE_SELECTORS = [
+    # Meta tags
+    'meta[property="article:published_time"]',
+    'meta[name="publishdate"]',
+    'meta[name="date"]',
+    'meta[name="publication-date"]',
+    'meta[property="og:updated_time"]',
+    
+    # Time tags
+    'time[datetime]',
+    'time[pubdate]',
+    
+    # Common class names
+    '.published', '.date', '.post-date', '.article-date', '.entry-date',
+]
+_AUTHOR_SELECTORS = [
+    # Meta tags
+    'meta[name="author"]',
+    'meta[property="article:author"]',
+    'meta[name="article:author"]',
+    
+    # Common class names
+    '.author', '.byline', '.writer', '.post-author', '.article-author', '.entry-author',
+]
+
+def _compile_ranked(selectors: List[str]):
+    """Compile a priority-ordered selector list into (joined, per-selector) matchers"""
+    return soupsieve.compile(', '.join(selectors)), [soupsieve.compile(s) for s in selectors]
+
+_DATE_MATCHERS = _compile_ranked(_DATE_SELECTORS)
+_AUTHOR_MATCHERS = _compile_ranked(_AUTHOR_SELECTORS)
+
+def _select_ranked(soup: BeautifulSoup, matchers) -> List[Tag]:
+    """
+    Select all matches in one traversal, ordered by the first selector each element matches
+    and then by document order (the order of running each selector separately, minus repeats)
+    """
+    joined, ranked = matchers
+    elements = joined.select(soup)
+    return sorted(elements, key=lambda el: next(i for i, m in enumerate(ranked) if m.match(el)))
+
+@lru_cache(maxsize=256)
+def _compile_css(selector: str) -> soupsieve.SoupSieve:
+    """Compile a configured CSS selector once per unique string"""
+    return soupsieve.compile(selector)
+
+# Tags whose strings BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = ['script', 'style', 'template', 'rt', 'rp']
+_NON_TEXT_SELECTOR = ', '.join(_NON_TEXT_TAGS)
+
+def _fast_first(node, selector: str):
+    """First descendant of a selectolax node matching selector (lexbor also matches the node itself)"""
+    for match in node.css(selector):
+        if match != node:
+            return match
+    return None
+
+def _fast_text(node) -> str:
+    """Text of a selectolax node, skipping the same strings as BeautifulSoup's get_text()"""
+    if node.css_first(_NON_TEXT_SELECTOR) is not None:
+        node = node.clone()
+        node.strip_tags(_NON_TEXT_TAGS)
+    return node.text(deep=True)
+
+# Tags _extract_title reads, kept when article pages are parsed with a strainer
+_TITLE_TAGS = ('title', 'meta', 'h1', 'h2')
+_SIMPLE_SELECTOR = re.compile(r'([a-zA-Z][a-zA-Z0-9-]*)(?:[.#][\w-]+)*')
+
+@lru_cache(maxsize=64)
+def _article_strainer(content_selector: str) -> Optional[SoupStrainer]:
+    """
+    Strainer that only builds the title tags and elements with the content selector's tag name
+    
+    Only for simple selectors like 'article' or 'div.content': every element with that tag is
+    kept whole, so its first match is the same as on the full tree. Returns None for anything
+    else (no tag name, combinators, attributes, pseudo-classes).
+    """
+    match = _SIMPLE_SELECTOR.fullmatch(content_selector.strip())
+    if not match:
+        return None
+    return SoupStrainer(list(_TITLE_TAGS) + [match.group(1).lower()])
+
+@lru_cache(maxsize=256)
+def _compile_lxml_css(selector: str, first_descendant: bool = False):
+    """
+    Translate a CSS selector to a compiled XPath, or None if cssselect can't
+    
+    first_descendant gives soupsieve select_one semantics on an element (descendants only,
+    first match); otherwise it matches like select on a document.
+    """
+    try:
+        if first_descendant:
+            return etree.XPath(f"({HTMLTranslator().css_to_xpath(selector, prefix='descendant::')})[1]")
+        return etree.XPath(HTMLTranslator().css_to_xpath(selector))
+    except SelectorError:
+        return None
+
+def _lxml_first(element, selector: str):
+    """First descendant of an lxml element matching a CSS selector"""
+    matches = _compile_lxml_css(selector, True)(element)
+    return matches[0] if matches else None
+
+def _lxml_text(element) -> str:
+    """Text of an lxml element, skipping the same strings as BeautifulSoup's get_text()"""
+    if element.tag in _NON_TEXT_TAGS:
+        return ''
+    if next(element.iterdescendants(*_NON_TEXT_TAGS), None) is not None:
+        element = copy.deepcopy(element)
+        for node in list(element.iterdescendants(*_NON_TEXT_TAGS)):
+            node.drop_tree()
+    return ''.join(element.itertext())
+
+def _source_url_of(url: str) -> str:
+    """Scheme and host of an article URL, from a single urlparse"""
+    parsed = urlparse(url)
+    return parsed.scheme + '://' + parsed.netloc
 
 class ContentExtractor:
     """Extract article content and metadata from HTML"""
     
-    def __init__(self):
+    def __init__(self, fast_archive: bool = False):
         self.logger = logging.getLogger('burmese_scraper.extractor')
+        
+        # Parse archive pages with selectolax instead of BeautifulSoup
+        self.fast_archive = fast_archive and SELECTOLAX_AVAILABLE
+        if fast_archive and not SELECTOLAX_AVAILABLE:
+            self.logger.warning("selectolax not installed, using BeautifulSoup for archive pages")
     
-    def extract_archive_items(self, content: str, base_url: str, 
+    def extract_archive_items(self, content: Union[str, BeautifulSoup], base_url: str, 
                             item_selector: str, thumbnail_selector: str = None) -> List[Dict[str, Any]]:
         """
         Extract archive items from archive/list page
         
         Args:
-            content: HTML content of archive page
+            content: HTML content of archive page, or an already parsed BeautifulSoup
             base_url: Base URL for resolving relative links
             item_selector: CSS/XPath selector for archive items
             thumbnail_selector: Optional selector for thumbnails
@@ -33,37 +209,66 @@ class ContentExtractor:
         Returns:
             List of archive item dictionaries
         """
-        items = []
+        return list(self.iter_archive_items(content, base_url, item_selector, thumbnail_selector))
+    
+    def iter_archive_items(self, content: Union[str, BeautifulSoup], base_url: str, 
+                           item_selector: str, thumbnail_selector: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield archive items from archive/list page one at a time, so callers can start
+        on the first items before the rest are extracted
         
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
+        Args:
+            content: HTML content of archive page, or an already parsed BeautifulSoup
+            base_url: Base URL for resolving relative links
+            item_selector: CSS/XPath selector for archive items
+            thumbnail_selector: Optional selector for thumbnails
             
-            # Find archive items
-            if self._is_css_selector(item_selector):
-                elements = soup.select(item_selector)
-            else:
-                # For XPath, we'll treat as CSS for now
-                self.logger.warning(f"XPath selector '{item_selector}' treated as CSS")
-                elements = soup.select(item_selector)
+        Yields:
+            Archive item dictionaries
+        """
+        elements = None
+        extract_item = self._extract_single_archive_item
+        
+        try:
+            if self.fast_archive and isinstance(content, str) and self._is_css_selector(item_selector):
+                elements = self._select_archive_items_fast(content, item_selector, thumbnail_selector)
+                if elements is not None:
+                    extract_item = self._extract_single_archive_item_fast
             
-            self.logger.info(f"Found {len(elements)} archive items")
+            if elements is None and LXML_SELECT_AVAILABLE and isinstance(content, str) \
+                    and self._is_css_selector(item_selector):
+                elements = self._select_archive_items_lxml(content, item_selector, thumbnail_selector)
+                if elements is not None:
+                    extract_item = self._extract_single_archive_item_lxml
             
-            for i, element in enumerate(elements):
-                try:
-                    item = self._extract_single_archive_item(
-                        element, base_url, thumbnail_selector
-                    )
-                    if item:
-                        items.append(item)
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error extracting archive item {i}: {e}")
-                    continue
+            if elements is None:
+                soup = self._parse(content)
+                
+                # Find archive items
+                if self._is_css_selector(item_selector):
+                    elements = _compile_css(item_selector).select(soup)
+                else:
+                    # For XPath, we'll treat as CSS for now
+                    self.logger.warning(f"XPath selector '{item_selector}' treated as CSS")
+                    elements = _compile_css(item_selector).select(soup)
             
         except Exception as e:
             self.logger.error(f"Error extracting archive items: {e}")
+            return
         
-        return items
+        self.logger.info("Found %d archive items", len(elements))
+        
+        for i, element in enumerate(elements):
+            try:
+                item = extract_item(
+                    element, base_url, thumbnail_selector
+                )
+            except Exception as e:
+                self.logger.warning("Error extracting archive item %d: %s", i, e)
+                continue
+            
+            if item:
+                yield item
     
     def _extract_single_archive_item(self, element: Tag, base_url: str, 
                                    thumbnail_selector: str = None) -> Optional[Dict[str, Any]]:
@@ -73,32 +278,39 @@ class ContentExtractor:
         link_element = None
         
         # Check if the element itself is a link
-        if element.name == 'a' and element.get('href'):
+        href = element.get('href') if element.name == 'a' else None
+        if href:
             link_element = element
         else:
             # Look for link inside the element
             link_element = element.find('a')
-            if not link_element or not link_element.get('href'):
+            href = link_element.get('href') if link_element else None
+            if not href:
                 # Try to find link in children
                 link_element = element.find('a', href=True)
+                href = link_element.get('href') if link_element else None
         
         if not link_element:
             self.logger.warning("No link found in archive item")
             return None
         
         # Extract URL (clean/stripped)
-        relative_url = link_element.get('href').strip()
+        relative_url = href.strip()
         article_url = normalize_url(base_url, relative_url)
         
         # Extract title (clean/stripped) - try link text first, then look for title elements
         title = clean_text(link_element.get_text())
         
         # Try to find a better title from common title elements within the archive item
-        title_selectors = ['h1', 'h2', 'h3', '.title', '.headline', '.post-title', '.article-title']
-        for selector in title_selectors:
-            title_element = element.select_one(selector)
+        for selector in _ARCHIVE_TITLE_SELECTORS:
+            title_element = selector.select_one(element)
             if title_element:
-                potential_title = clean_text(title_element.get_text())
+                # Cleaning only shortens text, so a raw text no longer than the
+                # current title can't win and is never cleaned
+                raw_title = title_element.get_text()
+                if len(raw_title) <= len(title):
+                    continue
+                potential_title = clean_text(raw_title)
                 if potential_title and len(potential_title) > len(title):
                     title = potential_title
                     break
@@ -113,34 +325,206 @@ class ContentExtractor:
         if thumbnail_selector:
             try:
                 if self._is_css_selector(thumbnail_selector):
-                    thumb_element = element.select_one(thumbnail_selector)
+                    thumb_element = _compile_css(thumbnail_selector).select_one(element)
                 else:
                     # Treat XPath as CSS for now
-                    thumb_element = element.select_one(thumbnail_selector)
+                    thumb_element = _compile_css(thumbnail_selector).select_one(element)
                 
                 if thumb_element:
                     # Try different attributes for image URL
                     thumb_url = None
-                    for attr in ['src', 'data-src', 'data-lazy-src', 'data-original', 'data-lazy']:
-                        if thumb_element.get(attr):
-                            thumb_url = normalize_url(base_url, thumb_element.get(attr).strip())
+                    for attr in _THUMBNAIL_ATTRS:
+                        value = thumb_element.get(attr)
+                        if value:
+                            thumb_url = normalize_url(base_url, value.strip())
                             break
                     
                     if thumb_url:
                         item['thumbnail_url'] = thumb_url
                         
             except Exception as e:
-                self.logger.warning(f"Error extracting thumbnail: {e}")
+                self.logger.warning("Error extracting thumbnail: %s", e)
+        
+        return item
+    
+    def _select_archive_items_lxml(self, content: str, item_selector: str,
+                                   thumbnail_selector: str = None) -> Optional[List[Any]]:
+        """
+        Select archive items on an lxml tree (the same libxml2 tree BeautifulSoup's lxml builder gets)
+        
+        Returns None when cssselect can't translate the item or thumbnail selector, or the page is
+        empty, so the caller falls back to BeautifulSoup
+        """
+        item_xpath = _compile_lxml_css(item_selector)
+        if item_xpath is None:
+            return None
+        if thumbnail_selector and (not self._is_css_selector(thumbnail_selector)
+                                   or _compile_lxml_css(thumbnail_selector, True) is None):
+            return None
+        if not content.strip():
+            return None
+        
+        tree = lxml_html.document_fromstring(content.encode('utf-8'), parser=_LXML_PARSER)
+        return item_xpath(tree)
+    
+    def _extract_single_archive_item_lxml(self, element, base_url: str,
+                                          thumbnail_selector: str = None) -> Optional[Dict[str, Any]]:
+        """Extract data from a single lxml archive item element (mirrors _extract_single_archive_item)"""
+        
+        # Find the main link
+        href = element.get('href') if element.tag == 'a' else None
+        if href:
+            link_element = element
+        else:
+            # Look for link inside the element
+            link_element = next(element.iterdescendants('a'), None)
+            href = link_element.get('href') if link_element is not None else None
+            if not href:
+                # Try to find link in children
+                link_element = next((a for a in element.iterdescendants('a') if a.get('href') is not None), None)
+                href = link_element.get('href') if link_element is not None else None
+        
+        if link_element is None:
+            self.logger.warning("No link found in archive item")
+            return None
+        
+        # Extract URL (clean/stripped)
+        relative_url = href.strip()
+        article_url = normalize_url(base_url, relative_url)
+        
+        # Extract title (clean/stripped) - try link text first, then look for title elements
+        title = clean_text(_lxml_text(link_element))
+        
+        for selector in _ARCHIVE_TITLE_SELECTOR_STRINGS:
+            title_element = _lxml_first(element, selector)
+            if title_element is not None:
+                # Cleaning only shortens text, so a raw text no longer than the
+                # current title can't win and is never cleaned
+                raw_title = _lxml_text(title_element)
+                if len(raw_title) <= len(title):
+                    continue
+                potential_title = clean_text(raw_title)
+                if potential_title and len(potential_title) > len(title):
+                    title = potential_title
+                    break
+        
+        item = {
+            'url': article_url,
+            'title': title,
+            'thumbnail_url': None
+        }
+        
+        # Extract thumbnail if selector provided (clean/stripped URL)
+        if thumbnail_selector:
+            try:
+                thumb_element = _lxml_first(element, thumbnail_selector)
+                if thumb_element is not None:
+                    # Try different attributes for image URL
+                    for attr in _THUMBNAIL_ATTRS:
+                        value = thumb_element.get(attr)
+                        if value:
+                            thumb_url = normalize_url(base_url, value.strip())
+                            if thumb_url:
+                                item['thumbnail_url'] = thumb_url
+                            break
+                        
+            except Exception as e:
+                self.logger.warning("Error extracting thumbnail: %s", e)
         
         return item
     
-    def extract_article_content(self, content: str, url: str, content_selector: str,
+    def _select_archive_items_fast(self, content: str, item_selector: str,
+                                   thumbnail_selector: str = None) -> Optional[List[Any]]:
+        """
+        Select archive items with selectolax
+        
+        Returns None when lexbor can't parse the item or thumbnail selector, so the caller
+        falls back to BeautifulSoup
+        """
+        tree = LexborHTMLParser(content)
+        try:
+            elements = tree.css(item_selector)
+            if thumbnail_selector:
+                tree.css_first(thumbnail_selector)
+        except SelectolaxError:
+            self.logger.debug("selectolax can't parse selectors for '%s', using BeautifulSoup", item_selector)
+            return None
+        
+        return elements
+    
+    def _extract_single_archive_item_fast(self, element, base_url: str,
+                                          thumbnail_selector: str = None) -> Optional[Dict[str, Any]]:
+        """Extract data from a single selectolax archive item node (mirrors _extract_single_archive_item)"""
+        
+        # Find the main link
+        href = element.attributes.get('href') if element.tag == 'a' else None
+        if href:
+            link_element = element
+        else:
+            # Look for link inside the element
+            link_element = _fast_first(element, 'a')
+            href = link_element.attributes.get('href') if link_element is not None else None
+            if not href:
+                # Try to find link in children
+                link_element = _fast_first(element, 'a[href]')
+                href = link_element.attributes.get('href') if link_element is not None else None
+        
+        if link_element is None:
+            self.logger.warning("No link found in archive item")
+            return None
+        
+        # Extract URL (clean/stripped); a bare href attribute has no value in selectolax
+        relative_url = (href or '').strip()
+        article_url = normalize_url(base_url, relative_url)
+        
+        # Extract title (clean/stripped) - try link text first, then look for title elements
+        title = clean_text(_fast_text(link_element))
+        
+        for selector in _ARCHIVE_TITLE_SELECTOR_STRINGS:
+            title_element = _fast_first(element, selector)
+            if title_element is not None:
+                # Cleaning only shortens text, so a raw text no longer than the
+                # current title can't win and is never cleaned
+                raw_title = _fast_text(title_element)
+                if len(raw_title) <= len(title):
+                    continue
+                potential_title = clean_text(raw_title)
+                if potential_title and len(potential_title) > len(title):
+                    title = potential_title
+                    break
+        
+        item = {
+            'url': article_url,
+            'title': title,
+            'thumbnail_url': None
+        }
+        
+        # Extract thumbnail if selector provided (clean/stripped URL)
+        if thumbnail_selector:
+            try:
+                thumb_element = _fast_first(element, thumbnail_selector)
+                if thumb_element is not None:
+                    # Try different attributes for image URL
+                    for attr in _THUMBNAIL_ATTRS:
+                        value = thumb_element.attributes.get(attr)
+                        if value:
+                            thumb_url = normalize_url(base_url, value.strip())
+                            if thumb_url:
+                                item['thumbnail_url'] = thumb_url
+                            break
+                        
+            except Exception as e:
+                self.logger.warning("Error extracting thumbnail: %s", e)
+        
+        return item
+    
+    def extract_article_content(self, content: Union[str, BeautifulSoup], url: str, content_selector: str,
                               archive_url: str = None, engine: str = None) -> Optional[Dict[str, Any]]:
         """
         Extract article content and metadata from article page
         
         Args:
-            content: HTML content of article page
+            content: HTML content of article page, or an already parsed BeautifulSoup
             url: Article URL
             content_selector: CSS/XPath selector for main content
             archive_url: URL of archive page this article came from
@@ -151,17 +535,17 @@ class ContentExtractor:
         """
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = self._parse(content, _article_strainer(content_selector))
             
             # Extract main content
             if self._is_css_selector(content_selector):
-                content_element = soup.select_one(content_selector)
+                content_element = _compile_css(content_selector).select_one(soup)
             else:
                 # Treat XPath as CSS for now
-                content_element = soup.select_one(content_selector)
+                content_element = _compile_css(content_selector).select_one(soup)
             
             if not content_element:
-                self.logger.warning(f"Content selector '{content_selector}' not found in {url}")
+                self.logger.warning("Content selector '%s' not found in %s", content_selector, url)
                 return None
             
             # Extract raw HTML content (unprocessed from the specified identifier)
@@ -178,7 +562,7 @@ class ContentExtractor:
                 'thumbnail_url': None,  # Will be set from archive data
                 'raw_html_content': raw_html_content,  # Raw HTML from detail page content selector
                 'scraped_date': get_current_timestamp().split('T')[0],  # YYYY-MM-DD format
-                'source_url': urlparse(url).scheme + '://' + urlparse(url).netloc
+                'source_url': _source_url_of(url)
             }
             
             return article
@@ -192,101 +576,90 @@ class ContentExtractor:
                 'thumbnail_url': None,
                 'raw_html_content': None,
                 'scraped_date': get_current_timestamp().split('T')[0],
-                'source_url': urlparse(url).scheme + '://' + urlparse(url).netloc
+                'source_url': _source_url_of(url)
             }
     
     def _extract_title(self, soup: BeautifulSoup, content_element: Tag = None) -> Optional[str]:
         """Extract article title from various sources"""
         
-        # Try multiple title extraction methods
-        title_candidates = []
+        # Return the first valid title (usually the most reliable) without
+        # cleaning the remaining candidates
+        for candidate in self._iter_title_candidates(soup, content_element):
+            title = clean_text(candidate)
+            if title and len(title.strip()) > 5:
+                return title
+        
+        return None
+    
+    def _iter_title_candidates(self, soup: BeautifulSoup, content_element: Tag = None):
+        """Yield raw title candidates in priority order"""
+        
+        # Collect every candidate source in a single pass over the document
+        title_tag = og_title = twitter_title = None
+        h1_tags, h2_tags = [], []
+        for node in _TITLE_CANDIDATES.select(soup):
+            if node.name == 'h1':
+                h1_tags.append(node)
+            elif node.name == 'h2':
+                h2_tags.append(node)
+            elif node.name == 'title':
+                if title_tag is None:
+                    title_tag = node
+            else:
+                if og_title is None and node.get('property') == 'og:title':
+                    og_title = node
+                if twitter_title is None and node.get('name') == 'twitter:title':
+                    twitter_title = node
         
         # 1. HTML title tag
-        title_tag = soup.find('title')
-        if title_tag:
-            title_candidates.append(clean_text(title_tag.get_text()))
+        if title_tag is not None:
+            yield title_tag.get_text()
         
         # 2. Open Graph title
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            title_candidates.append(clean_text(og_title.get('content')))
+        if og_title is not None and og_title.get('content'):
+            yield og_title.get('content')
         
         # 3. Twitter title
-        twitter_title = soup.find('meta', attrs={'name': 'twitter:title'})
-        if twitter_title and twitter_title.get('content'):
-            title_candidates.append(clean_text(twitter_title.get('content')))
+        if twitter_title is not None and twitter_title.get('content'):
+            yield twitter_title.get('content')
         
         # 4. H1 tags
-        h1_tags = soup.find_all('h1')
         for h1 in h1_tags:
-            title_candidates.append(clean_text(h1.get_text()))
+            yield h1.get_text()
         
         # 5. H2 tags (if no H1)
-        if not any(h1_tags):
-            h2_tags = soup.find_all('h2')
+        if not h1_tags:
             for h2 in h2_tags:
-                title_candidates.append(clean_text(h2.get_text()))
+                yield h2.get_text()
         
-        # 6. Title from content element
-        if content_element:
+        # 6. Title from content element (already yielded above if it's part of this page's h1s)
+        if content_element is not None:
             content_h1 = content_element.find('h1')
-            if content_h1:
-                title_candidates.append(clean_text(content_h1.get_text()))
-        
-        # Filter and select best title
-        valid_titles = [t for t in title_candidates if t and len(t.strip()) > 5]
-        
-        if valid_titles:
-            # Return the first valid title (usually the most reliable)
-            return valid_titles[0]
-        
-        return None
+            if content_h1 is not None and content_h1 not in h1_tags:
+                yield content_h1.get_text()
     
     def _extract_published_date(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract published date from various sources"""
         
-        # Try multiple date extraction methods
-        date_selectors = [
-            # Meta tags
-            ('meta', {'property': 'article:published_time'}),
-            ('meta', {'name': 'publishdate'}),
-            ('meta', {'name': 'date'}),
-            ('meta', {'name': 'publication-date'}),
-            ('meta', {'property': 'og:updated_time'}),
-            
-            # Time tags
-            ('time', {'datetime': True}),
-            ('time', {'pubdate': True}),
-            
-            # Common class names
-            ('.published', {}),
-            ('.date', {}),
-            ('.post-date', {}),
-            ('.article-date', {}),
-            ('.entry-date', {}),
-        ]
-        
-        for selector, attrs in date_selectors:
+        # Try multiple date extraction methods (meta tags, time tags, common class names)
+        try:
+            elements = _select_ranked(soup, _DATE_MATCHERS)
+        except Exception:
+            return None
+        
+        for element in elements:
             try:
-                if selector.startswith('.'):
-                    # CSS class selector
-                    elements = soup.select(selector)
-                else:
-                    # Tag with attributes
-                    elements = soup.find_all(selector, attrs)
+                # Try different attributes
+                for attr in ['datetime', 'content', 'value']:
+                    date_value = element.get(attr)
+                    if date_value:
+                        return self._normalize_date(date_value)
                 
-                for element in elements:
-                    # Try different attributes
-                    for attr in ['datetime', 'content', 'value']:
-                        date_value = element.get(attr)
-                        if date_value:
-                            return self._normalize_date(date_value)
+                # Try text content
+                text = clean_text(element.get_text())
+                if text and self._looks_like_date(text):
+                    return self._normalize_date(text)
                     
-                    # Try text content
-                    text = clean_text(element.get_text())
-                    if text and self._looks_like_date(text):
-                        return self._normalize_date(text)
-                        
             except Exception:
                 continue
         
@@ -295,64 +668,52 @@ class ContentExtractor:
     def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract author from various sources"""
         
-        # Try multiple author extraction methods
-        author_selectors = [
-            # Meta tags
-            ('meta', {'name': 'author'}),
-            ('meta', {'property': 'article:author'}),
-            ('meta', {'name': 'article:author'}),
-            
-            # Common class names
-            ('.author', {}),
-            ('.byline', {}),
-            ('.writer', {}),
-            ('.post-author', {}),
-            ('.article-author', {}),
-            ('.entry-author', {}),
-        ]
-        
-        for selector, attrs in author_selectors:
+        # Try multiple author extraction methods (meta tags, common class names)
+        try:
+            elements = _select_ranked(soup, _AUTHOR_MATCHERS)
+        except Exception:
+            return None
+        
+        for element in elements:
             try:
-                if selector.startswith('.'):
-                    # CSS class selector
-                    elements = soup.select(selector)
-                else:
-                    # Tag with attributes
-                    elements = soup.find_all(selector, attrs)
+                # Try content attribute first
+                author = element.get('content')
+                if author:
+                    return clean_text(author)
                 
-                for element in elements:
-                    # Try content attribute first
-                    author = element.get('content')
-                    if author:
-                        return clean_text(author)
+                # Try text content
+                text = clean_text(element.get_text())
+                if text and len(text) < 100:  # Reasonable author name length
+                    return text
                     
-                    # Try text content
-                    text = clean_text(element.get_text())
-                    if text and len(text) < 100:  # Reasonable author name length
-                        return text
-                        
             except Exception:
                 continue
         
         return None
     
+    def _parse(self, content: Union[str, BeautifulSoup], strainer: SoupStrainer = None) -> BeautifulSoup:
+        """Parse HTML content (optionally only the parts a strainer keeps), reusing it as-is if the caller already parsed it"""
+        if isinstance(content, BeautifulSoup):
+            return content
+        return BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+    
     def _is_css_selector(self, selector: str) -> bool:
         """Check if selector is CSS (vs XPath)"""
-        xpath_indicators = ['/', 'text()', 'contains(', 'following-sibling', 'preceding-sibling', '@']
-        return not any(indicator in selector for indicator in xpath_indicators)
+        return is_css_selector(selector)
     
     def _normalize_date(self, date_str: str) -> str:
         """Normalize date string to ISO format"""
         try:
             # Remove extra whitespace
             date_str = clean_text(date_str)
+            if _DATE_PARSER is None:
+                return date_str
             
             # Try to parse various date formats
-            from dateutil import parser
-            parsed_date = parser.parse(date_str)
+            parsed_date = _DATE_PARSER.parse(date_str)
             return parsed_date.isoformat()
             
-        except:
+        except (ValueError, OverflowError, TypeError):
             # Return original string if parsing fails
             return date_str
     
@@ -362,15 +723,4 @@ class ContentExtractor:
             return False
         
         # Simple heuristics for date detection
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-            r'\w+ \d{1,2}, \d{4}', # Month DD, YYYY
-        ]
-        
-        for pattern in date_patterns:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        return _DATE_PATTERN.search(text) is not None
@@ -9,6 +9,7 @@ import logging
 import math
 import sys
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from tqdm import tqdm
@@ -30,11 +31,35 @@ from .crawler import WebCrawler
 from .extractor import ContentExtractor
 from .storage import DataStorage
 
+# Articles fetched together by get_pages_batch when processing a URLs file
+ARTICLE_BATCH_SIZE = 32
+
+# Archive pages probed together by get_pages_batch in unlimited pagination mode (at most this
+# many pages past the last one with items are fetched before stopping)
+ARCHIVE_PROBE_BATCH = 5
+
+# Per-process extractor for article parsing workers (set up once by _init_parse_worker)
+_worker_extractor = None
+
+def _init_parse_worker(fast_archive: bool, log_level: int) -> None:
+    """Build the content extractor once per worker process"""
+    global _worker_extractor
+    logging.getLogger().setLevel(log_level)
+    _worker_extractor = ContentExtractor(fast_archive=fast_archive)
+
+def _extract_article_worker(content: str, article_url: str, content_selector: str,
+                            archive_url: str, engine_name: str) -> Optional[Dict[str, Any]]:
+    """Extract one fetched article page in a worker process"""
+    return _worker_extractor.extract_article_content(
+        content, article_url, content_selector, archive_url, engine_name
+    )
+
 class BurmeseCorpusScraper:
     """Main scraper class"""
     
     def __init__(self, proxy_rotator=None, header_rotator=None, 
-                 delay=(0.5, 1.0), timeout=30, respect_robots=True):
+                 delay=(0.5, 1.0), timeout=30, respect_robots=True, fast_archive=False,
+                 parse_workers=1):
         self.proxy_rotator = proxy_rotator
         self.header_rotator = header_rotator
         self.delay = delay
@@ -53,9 +78,16 @@ class BurmeseCorpusScraper:
         self.archive_engine = None
         self.detail_engine = None
         
-        self.extractor = ContentExtractor()
+        self.extractor = ContentExtractor(fast_archive=fast_archive)
         self.logger = logging.getLogger('burmese_scraper')
         
+        # Article pages from a URLs file are parsed in this many worker processes (1 = in-process)
+        self.parse_workers = parse_workers
+        self._parse_pool = None
+        
+        # Archive items already extracted while probing pagination, by archive page URL
+        self._probed_archive_items = {}
+        
         # Statistics
         self.stats = {
             'archive_pages_processed': 0,
@@ -170,7 +202,8 @@ class BurmeseCorpusScraper:
                 print("No skip archive mode")
                 # Get archive URLs to process
                 archive_urls = self._get_archive_urls(
-                    archive_url, pagination_type, pagination_param, max_pages, archive_selector, resume_page, pagination_increment
+                    archive_url, pagination_type, pagination_param, max_pages, archive_selector, resume_page, pagination_increment,
+                    thumbnail_selector
                 )
                 
                 self.logger.info(f"Will process {len(archive_urls)} archive pages")
@@ -215,6 +248,7 @@ class BurmeseCorpusScraper:
         
         finally:
             # Cleanup
+            storage.flush()
             self.crawler.cleanup()
     
     def _validate_archive_page(self, archive_url: str, archive_selector: str) -> bool:
@@ -239,7 +273,8 @@ class BurmeseCorpusScraper:
         return True
     
     def _get_archive_urls(self, base_url: str, pagination_type: str, 
-                         pagination_param: str = None, max_pages: int = None, archive_selector: str = None, resume_page: int = None, pagination_increment: int = 1) -> List[str]:
+                         pagination_param: str = None, max_pages: int = None, archive_selector: str = None, resume_page: int = None, pagination_increment: int = 1,
+                         thumbnail_selector: str = None) -> List[str]:
         """Get list of archive URLs to process based on pagination type"""
         
         urls = [base_url]
@@ -296,50 +331,56 @@ class BurmeseCorpusScraper:
                 max_consecutive_empty = 5  # Stop after 5 consecutive empty pages
                 max_safety_limit = 1600   # Safety limit to prevent infinite loops
                 
-                while page <= max_safety_limit:
-                    # Calculate page value based on increment
-                    if pagination_increment == 1:
-                        page_value = page
-                    else:
-                        # For custom increments: page 2 = increment, page 3 = increment*2, etc.
-                        page_value = (page - 1) * pagination_increment
+                while page <= max_safety_limit and consecutive_empty < max_consecutive_empty:
+                    # Fetch the next few candidate pages together, then check them in order
+                    batch = []
+                    for batch_page in range(page, min(page + ARCHIVE_PROBE_BATCH, max_safety_limit + 1)):
+                        # Calculate page value based on increment
+                        if pagination_increment == 1:
+                            page_value = batch_page
+                        else:
+                            # For custom increments: page 2 = increment, page 3 = increment*2, etc.
+                            page_value = (batch_page - 1) * pagination_increment
+                        
+                        param = pagination_param.replace('{n}', str(page_value))
+                        if param.startswith('?') or param.startswith('&'):
+                            batch.append(base_url + param)
+                        else:
+                            batch.append(base_url.rstrip('/') + '/' + param.lstrip('/'))
                     
-                    param = pagination_param.replace('{n}', str(page_value))
-                    if param.startswith('?') or param.startswith('&'):
-                        next_url = base_url + param
-                    else:
-                        next_url = base_url.rstrip('/') + '/' + param.lstrip('/')
+                    contents = self.crawler.get_pages_batch(batch)
                     
-                    # Test if page has content
-                    content = self.crawler.get_page_content(next_url)
-                    if not content:
-                        consecutive_empty += 1
-                        self.logger.info(f"Page {page} is empty ({consecutive_empty}/{max_consecutive_empty})")
-                        if consecutive_empty >= max_consecutive_empty:
-                            self.logger.info(f"Stopping: {consecutive_empty} consecutive empty pages found")
-                            break
-                    else:
-                        # Quick check if page has archive items
-                        from .extractor import ContentExtractor
-                        extractor = ContentExtractor()
-                        try:
-                            items = extractor.extract_archive_items(content, archive_selector)
-                            if not items:
-                                consecutive_empty += 1
-                                self.logger.info(f"Page {page} has no archive items ({consecutive_empty}/{max_consecutive_empty})")
-                                if consecutive_empty >= max_consecutive_empty:
-                                    self.logger.info(f"Stopping: {consecutive_empty} consecutive pages with no items")
-                                    break
-                            else:
-                                consecutive_empty = 0  # Reset counter
-                                urls.append(next_url)
-                                self.logger.info(f"Page {page} has {len(items)} items - continuing")
-                        except:
+                    for next_url, content in zip(batch, contents):
+                        # Test if page has content
+                        if not content:
                             consecutive_empty += 1
+                            self.logger.info(f"Page {page} is empty ({consecutive_empty}/{max_consecutive_empty})")
                             if consecutive_empty >= max_consecutive_empty:
+                                self.logger.info(f"Stopping: {consecutive_empty} consecutive empty pages found")
                                 break
-                    
-                    page += 1
+                        else:
+                            # Quick check if page has archive items; they are kept so the page isn't fetched again
+                            try:
+                                items = self.extractor.extract_archive_items(
+                                    content, next_url, archive_selector, thumbnail_selector
+                                )
+                                if not items:
+                                    consecutive_empty += 1
+                                    self.logger.info(f"Page {page} has no archive items ({consecutive_empty}/{max_consecutive_empty})")
+                                    if consecutive_empty >= max_consecutive_empty:
+                                        self.logger.info(f"Stopping: {consecutive_empty} consecutive pages with no items")
+                                        break
+                                else:
+                                    consecutive_empty = 0  # Reset counter
+                                    urls.append(next_url)
+                                    self._probed_archive_items[next_url] = items
+                                    self.logger.info(f"Page {page} has {len(items)} items - continuing")
+                            except:
+                                consecutive_empty += 1
+                                if consecutive_empty >= max_consecutive_empty:
+                                    break
+                        
+                        page += 1
                 
                 self.logger.info(f"Generated {len(urls)} total pages (including base page)")
         
@@ -372,18 +413,23 @@ class BurmeseCorpusScraper:
                 if not content:
                     self.logger.warning("Load more pagination failed, falling back to regular content")
                     content = self.crawler.get_page_content(archive_url)
+            elif archive_url in self._probed_archive_items:
+                # Already fetched and extracted while probing pagination
+                content = None
             else:
                 # Get archive page content normally
                 content = self.crawler.get_page_content(archive_url)
             
-            if not content:
-                self.logger.error(f"Could not fetch archive page: {archive_url}")
-                return []
-            
-            # Extract archive items
-            archive_items = self.extractor.extract_archive_items(
-                content, archive_url, archive_selector, thumbnail_selector
-            )
+            archive_items = self._probed_archive_items.pop(archive_url, None)
+            if archive_items is None:
+                if not content:
+                    self.logger.error(f"Could not fetch archive page: {archive_url}")
+                    return []
+                
+                # Extract archive items
+                archive_items = self.extractor.extract_archive_items(
+                    content, archive_url, archive_selector, thumbnail_selector
+                )
             
             if not archive_items:
                 self.logger.warning(f"No archive items found on {archive_url}")
@@ -398,8 +444,11 @@ class BurmeseCorpusScraper:
                 self.logger.info(f"Collected {len(urls)} URLs from archive page")
                 return urls
             
+            # Fetch robots.txt for the articles' domains up front, in parallel
+            self.crawler.prefetch_robots(item['url'] for item in archive_items)
+            
             # Process each article
-            with tqdm(archive_items, desc="Processing articles", unit="article") as pbar:
+            with tqdm(archive_items, desc="Processing articles", unit="article", mininterval=0.5) as pbar:
                 for item in pbar:
                     article_url = item['url']
                     article_id = generate_id(article_url)
@@ -407,7 +456,7 @@ class BurmeseCorpusScraper:
                     # Skip if already processed (resume functionality)
                     if article_id in existing_ids:
                         self.stats['articles_skipped'] += 1
-                        pbar.set_postfix(status="skipped (existing)")
+                        pbar.set_postfix(status="skipped (existing)", refresh=False)
                         continue
                     
                     # Process article
@@ -419,10 +468,10 @@ class BurmeseCorpusScraper:
                     if success:
                         self.stats['articles_saved'] += 1
                         existing_ids.add(article_id)  # Add to set to avoid duplicates
-                        pbar.set_postfix(status="saved")
+                        pbar.set_postfix(status="saved", refresh=False)
                     else:
                         self.stats['articles_skipped'] += 1
-                        pbar.set_postfix(status="failed")
+                        pbar.set_postfix(status="failed", refresh=False)
                     
                     self.stats['articles_processed'] += 1
             
@@ -440,6 +489,20 @@ class BurmeseCorpusScraper:
         try:
             # Get article content
             content = self.crawler.get_page_content(article_url)
+        except Exception as e:
+            self.logger.error(f"Error processing article {article_url}: {e}")
+            return False
+        
+        return self._process_article_content(
+            article_url, content, content_selector, storage, archive_url, thumbnail_url
+        )
+    
+    def _process_article_content(self, article_url: str, content: Optional[str], content_selector: str,
+                                 storage: DataStorage, archive_url: str,
+                                 thumbnail_url: str = None) -> bool:
+        """Extract and save an article whose page has already been fetched"""
+        
+        try:
             if not content:
                 self.logger.warning(f"Could not fetch article: {article_url}")
                 return False
@@ -450,6 +513,17 @@ class BurmeseCorpusScraper:
                 archive_url, self.crawler.current_engine.__class__.__name__
             )
             
+            return self._save_article(article_url, article, storage, thumbnail_url)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing article {article_url}: {e}")
+            return False
+    
+    def _save_article(self, article_url: str, article: Optional[Dict[str, Any]],
+                      storage: DataStorage, thumbnail_url: str = None) -> bool:
+        """Save an extracted article"""
+        
+        try:
             if not article:
                 self.logger.warning(f"Could not extract content from: {article_url}")
                 return False
@@ -526,31 +600,99 @@ class BurmeseCorpusScraper:
         
         self.logger.info(f"Processing {len(urls)} articles from URLs file")
         
-        with tqdm(urls, desc="Processing articles", unit="article") as pbar:
-            for article_url in pbar:
+        # Fetch robots.txt for the articles' domains up front, in parallel
+        self.crawler.prefetch_robots(urls)
+        
+        if self.parse_workers > 1:
+            # Each fetched batch is parsed across worker processes instead of one page at a time here
+            with ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker,
+                                     initargs=(self.extractor.fast_archive, logging.getLogger().level)) as pool:
+                self._parse_pool = pool
+                try:
+                    self._process_url_batches(urls, content_selector, storage, existing_ids, archive_url)
+                finally:
+                    self._parse_pool = None
+        else:
+            self._process_url_batches(urls, content_selector, storage, existing_ids, archive_url)
+    
+    def _process_url_batches(self, urls: List[str], content_selector: str,
+                             storage: DataStorage, existing_ids: set, archive_url: str):
+        """Fetch URLs in batches and extract and save each article in order"""
+        fetched = {}
+        with tqdm(urls, desc="Processing articles", unit="article", mininterval=0.5) as pbar:
+            for index, article_url in enumerate(pbar):
                 article_id = generate_id(article_url)
                 
                 # Skip if already processed
                 if article_id in existing_ids:
                     self.stats['articles_skipped'] += 1
-                    pbar.set_postfix(status="skipped (existing)")
+                    pbar.set_postfix(status="skipped (existing)", refresh=False)
                     continue
                 
-                # Process article
-                success = self._process_article(
-                    article_url, content_selector, storage, archive_url
-                )
+                # Fetch this article together with the next ones still to be processed
+                if article_url not in fetched:
+                    fetched = self._fetch_article_batch(urls, index, existing_ids, content_selector, archive_url)
+                
+                # Process article (a Future when the page is being parsed in a worker process)
+                page = fetched.pop(article_url, None)
+                if isinstance(page, Future):
+                    success = self._save_article(article_url, self._parsed_article(article_url, page), storage)
+                else:
+                    success = self._process_article_content(
+                        article_url, page, content_selector, storage, archive_url
+                    )
                 
                 if success:
                     self.stats['articles_saved'] += 1
                     existing_ids.add(article_id)
-                    pbar.set_postfix(status="saved")
+                    pbar.set_postfix(status="saved", refresh=False)
                 else:
                     self.stats['articles_skipped'] += 1
-                    pbar.set_postfix(status="failed")
+                    pbar.set_postfix(status="failed", refresh=False)
                 
                 self.stats['articles_processed'] += 1
     
+    def _fetch_article_batch(self, urls: List[str], start: int, existing_ids: set,
+                             content_selector: str, archive_url: str) -> Dict[str, Any]:
+        """
+        Fetch up to ARTICLE_BATCH_SIZE unprocessed URLs from urls[start:] in one get_pages_batch call
+        (concurrent with the requests engine), returning page content by URL; with a parse pool,
+        fetched pages are returned as Futures of their extracted articles instead
+        """
+        batch = []
+        seen = set()
+        for url in urls[start:]:
+            if len(batch) >= ARTICLE_BATCH_SIZE:
+                break
+            if url in seen or generate_id(url) in existing_ids:
+                continue
+            seen.add(url)
+            batch.append(url)
+        
+        try:
+            contents = self.crawler.get_pages_batch(batch)
+        except Exception as e:
+            self.logger.error(f"Error fetching article batch: {e}")
+            contents = [None] * len(batch)
+        
+        fetched = dict(zip(batch, contents))
+        if self._parse_pool:
+            engine_name = self.crawler.current_engine.__class__.__name__
+            for url, content in fetched.items():
+                if content:
+                    fetched[url] = self._parse_pool.submit(
+                        _extract_article_worker, content, url, content_selector, archive_url, engine_name
+                    )
+        return fetched
+    
+    def _parsed_article(self, article_url: str, future: Future) -> Optional[Dict[str, Any]]:
+        """Wait for an article parsed in a worker process"""
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Error processing article {article_url}: {e}")
+            return None
+    
     def _get_results(self, success: bool, error: str = None) -> Dict[str, Any]:
         """Get scraping results dictionary"""
         return {
@@ -578,16 +720,21 @@ class BurmeseCorpusScraper:
 @click.option('--use-proxy', is_flag=True, help='Use proxy rotation')
 @click.option('--test-proxies', is_flag=True, help='Test proxies before use')
 @click.option('--skip-archive', is_flag=True, help='Skip archive scraping, only scrape from existing URLs file')
+@click.option('--fast-archive', is_flag=True, help='Parse archive pages with selectolax (faster; requires selectolax)')
+@click.option('--parse-workers', default=1, type=int, help='Worker processes for parsing articles from the URLs file (0 = one per CPU core)')
 @click.option('--site', help='Site key from sites.yaml to use (e.g., voa_burmese, bbc_burmese)')
 @click.option('--category', help='Category within the site (e.g., myanmar, world, politics)')
 def main(output, format_type, force_engine, delay, timeout, ignore_robots,
-         resume, max_pages, log, log_level, use_proxy, test_proxies, skip_archive, site, category):
+         resume, max_pages, log, log_level, use_proxy, test_proxies, skip_archive, fast_archive, parse_workers, site, category):
     """Burmese Corpus Scraper CLI"""
     
     logger = None  # Will be set up after getting slug
     
     print("=== Burmese Corpus Scraper ===")
     
+    if parse_workers <= 0:
+        parse_workers = os.cpu_count() or 1
+    
     # Initialize variables
     slug = None
     archive_url = None
@@ -707,7 +854,9 @@ def main(output, format_type, force_engine, delay, timeout, ignore_robots,
                             header_rotator=category_header_rotator,
                             delay=delay_range,
                             timeout=site_config.get('timeout', timeout),
-                            respect_robots=not ignore_robots
+                            respect_robots=not ignore_robots,
+                            fast_archive=fast_archive,
+                            parse_workers=parse_workers
                         )
                         
                         # Determine resume page for this category
@@ -957,9 +1106,9 @@ def main(output, format_type, force_engine, delay, timeout, ignore_robots,
                 print("Run without --skip-archive first to generate the URLs file.")
                 sys.exit(1)
             
-            # Load URLs from file (one URL per line)
+            # Count URLs in the file (one URL per line); scrape() streams them in itself
             with open(urls_file, 'r', encoding='utf-8') as f:
-                all_urls = [line.strip() for line in f if line.strip()]
+                url_count = sum(1 for line in f if line.strip())
             
             # For skip-archive mode, we need to get config from sites.yaml
             if site:
@@ -978,7 +1127,7 @@ def main(output, format_type, force_engine, delay, timeout, ignore_robots,
             pagination_param = None
             thumbnail_selector = "img"
             
-            logger.info(f"Skip-archive mode: loaded {len(all_urls)} URLs from {urls_file}")
+            logger.info(f"Skip-archive mode: found {url_count} URLs in {urls_file}")
             
         elif env_mode:
             # Config mode: variables already set from sites.yaml or .env
@@ -1048,7 +1197,9 @@ def main(output, format_type, force_engine, delay, timeout, ignore_robots,
         header_rotator=header_rotator,
         delay=delay_range,
         timeout=timeout,
-        respect_robots=not ignore_robots
+        respect_robots=not ignore_robots,
+        fast_archive=fast_archive,
+        parse_workers=parse_workers
     )
     
     # Run scraper
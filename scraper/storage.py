@@ -7,9 +7,72 @@ Handles saving scraped data in various formats
 import json
 import logging
 import os
-from typing import Dict, List, Any, Optional
+import time
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Any, Optional
 from pathlib import Path
 
+# NDJSON lines are buffered and appended in one write once this many are pending or this many
+# seconds have passed since the last write; a crash loses at most one batch, which resume re-scrapes
+NDJSON_FLUSH_ARTICLES = 64
+NDJSON_FLUSH_INTERVAL = 0.5
+
+class ArticleIdIndex:
+    """
+    Compact set of article IDs for resume/skip checks, matched on 64-bit MD5 prefixes
+    
+    IDs from generate_id are MD5 hex digests; the IDs loaded from disk are kept as a sorted
+    array of their 64-bit prefixes (8 bytes each instead of a ~100-byte str in a set) and
+    looked up by bisection, as are IDs added during the run. Two IDs sharing a 64-bit prefix
+    count as the same ID. Non-MD5 IDs are kept whole in a small set.
+    """
+    
+    def __init__(self, ids: Iterable[str] = ()):
+        self._other = set()
+        prefixes = set()
+        for article_id in ids:
+            key = self._key(article_id)
+            if key is None:
+                self._other.add(article_id)
+            else:
+                prefixes.add(key)
+        self._loaded = array('Q', sorted(prefixes))
+        self._added = set()
+    
+    @staticmethod
+    def _key(article_id) -> Optional[int]:
+        """64-bit prefix of an MD5 hex ID, or None for IDs in any other format"""
+        if isinstance(article_id, str) and len(article_id) == 32:
+            try:
+                return int(article_id[:16], 16)
+            except ValueError:
+                return None
+        return None
+    
+    def __contains__(self, article_id) -> bool:
+        key = self._key(article_id)
+        if key is None:
+            return article_id in self._other
+        return self._has_key(key)
+    
+    def _has_key(self, key: int) -> bool:
+        """Whether a 64-bit prefix was loaded or added"""
+        if key in self._added:
+            return True
+        index = bisect_left(self._loaded, key)
+        return index < len(self._loaded) and self._loaded[index] == key
+    
+    def add(self, article_id):
+        key = self._key(article_id)
+        if key is None:
+            self._other.add(article_id)
+        elif not self._has_key(key):
+            self._added.add(key)
+    
+    def __len__(self) -> int:
+        return len(self._loaded) + len(self._added) + len(self._other)
+
 class DataStorage:
     """Handle storage of scraped article data"""
     
@@ -32,12 +95,14 @@ class DataStorage:
     
     def _init_ndjson(self):
         """Initialize NDJSON storage"""
-        # NDJSON files can be appended to directly
-        pass
+        # NDJSON files can be appended to directly; lines are batched until flush()
+        self._ndjson_buffer = []
+        self._last_flush = time.monotonic()
     
     def _init_json(self):
         """Initialize JSON array storage"""
-        # For JSON array, we need to manage the structure
+        # For JSON array, we need to manage the structure. Existing articles are only held
+        # until the first save rewrites the file; later saves append to it in place
         self._json_articles = []
         
         # Load existing data if file exists
@@ -75,25 +140,56 @@ class DataStorage:
             return False
     
     def _save_article_ndjson(self, article: Dict[str, Any]) -> bool:
-        """Save article in NDJSON format"""
+        """Save article in NDJSON format (buffered, see flush)"""
         try:
-            with open(self.output_file, 'a', encoding='utf-8') as f:
-                json.dump(article, f, ensure_ascii=False, separators=(',', ':'))
-                f.write('\n')
+            self._ndjson_buffer.append(json.dumps(article, ensure_ascii=False, separators=(',', ':')) + '\n')
+            if (len(self._ndjson_buffer) >= NDJSON_FLUSH_ARTICLES
+                    or time.monotonic() - self._last_flush >= NDJSON_FLUSH_INTERVAL):
+                return self.flush()
             return True
         except Exception as e:
             self.logger.error(f"Error saving NDJSON article: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Append any buffered NDJSON lines to the output file in a single write
+        
+        Returns:
+            True if the buffer was written (or was empty), False otherwise
+        """
+        if self.format_type != 'ndjson' or not self._ndjson_buffer:
+            return True
+        
+        self._last_flush = time.monotonic()
+        try:
+            with open(self.output_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(self._ndjson_buffer))
+        except Exception as e:
+            # Keep the lines buffered so the next flush retries them
+            self.logger.error(f"Error writing {len(self._ndjson_buffer)} NDJSON articles: {e}")
+            return False
+        
+        self._ndjson_buffer = []
+        return True
+    
     def _save_article_json(self, article: Dict[str, Any]) -> bool:
         """Save article in JSON array format"""
         try:
-            # Add to in-memory list
-            self._json_articles.append(article)
+            if self._json_articles is not None:
+                # First save: write existing articles plus this one as a complete array
+                self._json_articles.append(article)
+                with open(self.output_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._json_articles, f, ensure_ascii=False, indent=2)
+                self._json_articles = None
+                return True
             
-            # Write entire array to file
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(self._json_articles, f, ensure_ascii=False, indent=2)
+            # Later saves: overwrite the closing "\n]" with the new element, producing the same
+            # bytes as re-dumping the whole array (JSON strings never contain raw newlines)
+            element = json.dumps(article, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            with open(self.output_file, 'r+b') as f:
+                f.seek(-2, os.SEEK_END)
+                f.write((',\n  ' + element + '\n]').encode('utf-8'))
             
             return True
         except Exception as e:
@@ -116,51 +212,59 @@ class DataStorage:
             if self.save_article(article):
                 saved_count += 1
         
+        self.flush()
+        
         self.logger.info(f"Saved {saved_count}/{len(articles)} articles")
         return saved_count
     
-    def get_existing_ids(self) -> set:
+    def get_existing_ids(self) -> ArticleIdIndex:
         """
         Get set of existing article IDs from output file
         
         Returns:
-            Set of existing article IDs
+            Set-like ArticleIdIndex of existing article IDs
         """
-        existing_ids = set()
+        self.flush()
         
         if not os.path.exists(self.output_file):
-            return existing_ids
+            return ArticleIdIndex()
         
         try:
-            if self.format_type == 'ndjson':
-                with open(self.output_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            try:
-                                article = json.loads(line)
-                                if 'id' in article:
-                                    existing_ids.add(article['id'])
-                            except json.JSONDecodeError:
-                                continue
-            
-            elif self.format_type == 'json':
-                with open(self.output_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        for article in data:
-                            if isinstance(article, dict) and 'id' in article:
-                                existing_ids.add(article['id'])
-            
+            existing_ids = ArticleIdIndex(self._iter_existing_ids())
             self.logger.info(f"Found {len(existing_ids)} existing article IDs")
             
         except Exception as e:
             self.logger.warning(f"Error reading existing IDs: {e}")
+            existing_ids = ArticleIdIndex()
         
         return existing_ids
     
+    def _iter_existing_ids(self):
+        """Yield article IDs from the output file without holding the parsed articles"""
+        if self.format_type == 'ndjson':
+            with open(self.output_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            article = json.loads(line)
+                            if 'id' in article:
+                                yield article['id']
+                        except json.JSONDecodeError:
+                            continue
+        
+        elif self.format_type == 'json':
+            with open(self.output_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                if isinstance(data, list):
+                    for article in data:
+                        if isinstance(article, dict) and 'id' in article:
+                            yield article['id']
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
+        self.flush()
+        
         stats = {
             'output_file': self.output_file,
             'format_type': self.format_type,
@@ -195,6 +299,8 @@ class DataStorage:
         Returns:
             Path to backup file or None if no backup created
         """
+        self.flush()
+        
         if not os.path.exists(self.output_file):
             return None
         
@@ -220,6 +326,8 @@ class DataStorage:
         Returns:
             Validation results dictionary
         """
+        self.flush()
+        
         results = {
             'valid': False,
             'errors': [],
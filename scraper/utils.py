@@ -10,6 +10,7 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Set, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse
 
@@ -34,9 +35,9 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Remove extra whitespace (str.split() splits on the same characters as \s+ and drops
+    # leading/trailing runs, so this matches re.sub(r'\s+', ' ', text).strip() without a regex)
+    return ' '.join(text.split())
 
 def extract_domain(url: str) -> str:
     """Extract domain from URL"""
@@ -95,8 +96,9 @@ def load_existing_ids(output_file: str) -> set:
     
     return existing_ids
 
+@lru_cache(maxsize=256)
 def is_css_selector(selector: str) -> bool:
-    """Check if selector is CSS (vs XPath)"""
+    """Check if selector is CSS (vs XPath); cached since the same few selectors recur per page"""
     # Simple heuristic: XPath typically starts with / or // or contains xpath functions
     xpath_indicators = ['/', 'text()', 'contains(', 'following-sibling', 'preceding-sibling', '@']
     return not any(indicator in selector for indicator in xpath_indicators)
@@ -121,37 +123,16 @@ def validate_selector_format(selector: str) -> bool:
         return False
     
     # Check for XPath indicators (should be CSS only)
-    xpath_indicators = ['/', 'text()', 'contains(', 'following-sibling', 'preceding-sibling', '@']
-    if any(indicator in selector for indicator in xpath_indicators):
+    if not is_css_selector(selector):
         # Log warning but don't fail validation - let user decide
-        import logging
         logger = logging.getLogger('burmese_scraper.utils')
         logger.warning(f"Selector '{selector}' appears to contain XPath syntax - should be CSS only")
     
-    # Test with BeautifulSoup parser
+    # Compile with soupsieve (BeautifulSoup's CSS engine); invalid syntax raises here, so there
+    # is no need to parse a test document and run the selector against it
     try:
-        from bs4 import BeautifulSoup
-        
-        # Create a minimal test HTML document
-        test_html = """
-        <html>
-            <body>
-                <div class="content-right">
-                    <div>
-                        <article>
-                            <h4 class="title">Test</h4>
-                        </article>
-                    </div>
-                </div>
-            </body>
-        </html>
-        """
-        
-        soup = BeautifulSoup(test_html, 'html.parser')
-        
-        # Try to parse the selector - this will raise an exception if invalid
-        soup.select(selector)
-        
+        import soupsieve
+        soupsieve.compile(selector)
         return True
         
     except Exception:
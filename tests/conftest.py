@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the scraper, cleaner and utility packages importable from the repository root
+sys.path.insert(0, str(Path(__file__).parent.parent))
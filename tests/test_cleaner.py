@@ -0,0 +1,46 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from cleaner.main import DataCleaner
+
+CONFIG_FILE = str(Path(__file__).parent.parent / "cleaner.yaml")
+
+
+@pytest.fixture
+def cleaner(tmp_path, monkeypatch):
+    # DataCleaner creates data/clean relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return DataCleaner(CONFIG_FILE)
+
+
+def test_version_marker_cut_keeps_text_up_to_last_letter(cleaner):
+    text = "မြန်မာ သတင်း 2024 -- (English Version) some english text"
+    assert cleaner.clean_xinhua_content(text) == "မြန်မာ သတင်း"
+
+
+def test_version_marker_cut_is_linear_on_long_articles(cleaner):
+    # A regex lookahead from every letter made this quadratic (~10 s for 35 KB)
+    body = "မြန်မာစာ " * 20000
+    text = body + "123 English Version trailing text"
+    
+    started = time.perf_counter()
+    result = cleaner.clean_xinhua_content(text)
+    elapsed = time.perf_counter() - started
+    
+    assert result == body.strip()
+    assert elapsed < 1.0
+
+
+def test_removal_keywords_are_applied_in_configured_order(cleaner):
+    # Each keyword is its own pass, so an earlier removal can split a later keyword...
+    assert cleaner.clean_title("BBC Burmese news", ["Burmese", "BBC Burmese"]) == "BBC news"
+    assert cleaner.clean_text("BBC Burmese news", ["Burmese", "BBC Burmese"]) == "BBC news"
+    # ...or join the text around it into one
+    assert cleaner.clean_title("abc", ["b", "ac"]) == ""
+
+
+def test_html_entities_decoded_by_amp_are_still_replaced(cleaner):
+    # '&amp;' is replaced before '&lt;'/'&gt;', so entities it exposes are decoded too
+    assert cleaner.clean_unicode_and_html_entities("a &amp;amp;lt;b&amp;amp;gt; c") == "a <b> c"
@@ -0,0 +1,47 @@
+from scraper import crawler
+from scraper.crawler import AsyncRequestsEngine, RequestsEngine, WebCrawler, has_elements, select_elements
+
+PAGE = """
+<html><body>
+  <ul class="list">
+    <li><a class="story" href="/news/one">One</a></li>
+    <li><a class="story" href="/news/two">Two</a></li>
+    <li><a href="/about">About</a></li>
+    <li><a href="mailto:desk@example.com">Contact</a></li>
+  </ul>
+</body></html>
+"""
+
+
+def _hrefs(elements):
+    return [element.get('href') for element in elements]
+
+
+def test_css_attribute_selector_with_path_value_is_css():
+    # '/' and '@' in attribute values must not route the selector to XPath
+    assert _hrefs(select_elements(PAGE, 'a[href^="/news/"]')) == ['/news/one', '/news/two']
+    assert _hrefs(select_elements(PAGE, 'a[href*="@"]')) == ['mailto:desk@example.com']
+    assert _hrefs(select_elements(PAGE, 'a[href="/about"]')) == ['/about']
+    assert has_elements(PAGE, 'a[href^="/news/"]')
+    assert not has_elements(PAGE, 'a[href^="/sport/"]')
+
+
+def test_xpath_selectors_still_use_xpath():
+    assert _hrefs(select_elements(PAGE, '//a[@class="story"]')) == ['/news/one', '/news/two']
+    assert has_elements(PAGE, '//ul[@class="list"]/li')
+    assert not has_elements(PAGE, '//table')
+
+
+def test_batch_crawl_delay_is_looked_up_per_host(monkeypatch):
+    delays = {'slow.example': 5.0, 'fast.example': None}
+    monkeypatch.setattr(crawler, 'AIOHTTP_AVAILABLE', True)
+    monkeypatch.setattr(WebCrawler, 'get_crawl_delay', lambda self, url, user_agent=None: delays[crawler.urlparse(url).netloc])
+    monkeypatch.setattr(AsyncRequestsEngine, 'get_pages', lambda self, urls: [None] * len(urls))
+    
+    web_crawler = WebCrawler(delay=0)
+    web_crawler.current_engine = RequestsEngine(delay=0)
+    web_crawler.get_pages_batch(['https://fast.example/a', 'https://slow.example/b', 'https://fast.example/c'])
+    
+    engine = web_crawler._async_engine
+    assert engine.get_delay_time('slow.example') == 5.0
+    assert engine.get_delay_time('fast.example') == 0
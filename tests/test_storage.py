@@ -0,0 +1,41 @@
+import builtins
+
+from scraper.storage import ArticleIdIndex, DataStorage
+from scraper.utils import generate_id
+
+
+def test_article_id_index_add_does_not_double_count_loaded_ids():
+    loaded = [generate_id(f'https://example.com/{i}') for i in range(10)]
+    index = ArticleIdIndex(loaded + ['not-an-md5'])
+    assert len(index) == 11
+    
+    index.add(loaded[0])
+    index.add('not-an-md5')
+    assert len(index) == 11
+    
+    new_id = generate_id('https://example.com/new')
+    assert new_id not in index
+    index.add(new_id)
+    index.add(new_id)
+    assert new_id in index
+    assert len(index) == 12
+
+
+def test_ndjson_flush_keeps_lines_when_the_write_fails(tmp_path, monkeypatch):
+    output_file = tmp_path / 'articles.ndjson'
+    storage = DataStorage(str(output_file))
+    storage.save_article({'id': '1', 'url': 'https://example.com/1', 'scraped_at': 'now'})
+    
+    real_open = builtins.open
+    
+    def failing_open(file, mode='r', *args, **kwargs):
+        if 'a' in mode:
+            raise OSError('disk full')
+        return real_open(file, mode, *args, **kwargs)
+    
+    monkeypatch.setattr(builtins, 'open', failing_open)
+    assert storage.flush() is False
+    monkeypatch.setattr(builtins, 'open', real_open)
+    
+    assert storage.flush() is True
+    assert output_file.read_text(encoding='utf-8').count('\n') == 1
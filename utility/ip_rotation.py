@@ -12,6 +12,7 @@ Features:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from itertools import cycle
 import traceback
 import time
@@ -36,6 +37,13 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Latency-aware selection: EWMA smoothing for response time and error rate, how much a proxy's
+# latency must move before weights are rebuilt, and when a failing proxy is benched
+EWMA_ALPHA = 0.2
+WEIGHT_REBUILD_DELTA = 0.1
+MAX_CONSECUTIVE_FAILURES = 3
+PROXY_COOLDOWN = 300
+
 class ProxyRotator:
     def __init__(self, manual_proxies=None, max_proxies=20):
         """
@@ -51,6 +59,22 @@ class ProxyRotator:
         self.proxy_pool = None
         self.failed_proxies = set()
         
+        # Per-proxy stats from record_result: EWMA latency (ms), EWMA error rate, consecutive
+        # failures and cooldown end; selection weights are cached until the stats move enough
+        self.pool_proxies = []
+        self.latency_ms = {}
+        self.error_rate = {}
+        self.consecutive_failures = {}
+        self.cooldown_until = {}
+        self._weights = None
+        
+        # Reuse connections (keep-alive) across proxy tests and requests instead of a fresh
+        # TCP/TLS handshake per call; retries stay in make_request's proxy rotation
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
     def get_free_proxies(self):
         """
         Fetch free proxies from free-proxy-list.net
@@ -63,7 +87,7 @@ class ProxyRotator:
         
         try:
             url = 'https://free-proxy-list.net/'
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
             if LXML_AVAILABLE:
@@ -126,7 +150,7 @@ class ProxyRotator:
                 'https': f'http://{proxy}'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 test_url, 
                 proxies=proxy_dict, 
                 timeout=timeout,
@@ -206,6 +230,8 @@ class ProxyRotator:
         
         if working_proxies:
             self.proxy_pool = cycle(working_proxies)
+            self.pool_proxies = list(working_proxies)
+            self._weights = None
             logger.info(f"Created proxy pool with {len(working_proxies)} proxies")
             return self.proxy_pool
         else:
@@ -216,12 +242,77 @@ class ProxyRotator:
         """
         Get next proxy from the pool
         
+        Proxies are picked in rotation until record_result has timed any of them; after that
+        they are sampled with weight 1/(latency+1) * (1 - error rate), so fast, working proxies
+        carry most of the traffic. Untimed proxies count as 0 ms so each gets tried. Proxies
+        with more than MAX_CONSECUTIVE_FAILURES failures in a row sit out PROXY_COOLDOWN seconds.
+        
         Returns:
             str: Next proxy address or None if no proxies available
         """
-        if self.proxy_pool:
+        if not self.proxy_pool:
+            return None
+        
+        if not self.latency_ms:
             return next(self.proxy_pool)
-        return None
+        
+        now = time.monotonic()
+        if self._weights is None or any(now >= until for until in self.cooldown_until.values()):
+            self._rebuild_weights(now)
+        
+        proxies, weights = self._weights
+        if not proxies:
+            # Everything is cooling down; fall back to plain rotation
+            return next(self.proxy_pool)
+        return random.choices(proxies, weights=weights)[0]
+    
+    def _rebuild_weights(self, now):
+        """Recompute the selection table, releasing proxies whose cooldown has ended"""
+        for proxy, until in list(self.cooldown_until.items()):
+            if now >= until:
+                del self.cooldown_until[proxy]
+                self.consecutive_failures[proxy] = 0
+        
+        proxies = [proxy for proxy in self.pool_proxies if proxy not in self.cooldown_until]
+        weights = [
+            1.0 / (self.latency_ms.get(proxy, 0.0) + 1) * max(1.0 - self.error_rate.get(proxy, 0.0), 0.01)
+            for proxy in proxies
+        ]
+        self._weights = (proxies, weights)
+    
+    def record_result(self, proxy, elapsed, ok):
+        """
+        Record how a request through proxy went
+        
+        Args:
+            proxy (str): Proxy address the request used
+            elapsed (float): Seconds the request took
+            ok (bool): Whether it returned a usable response
+        """
+        if not proxy:
+            return
+        
+        elapsed_ms = elapsed * 1000
+        previous = self.latency_ms.get(proxy)
+        latency = elapsed_ms if previous is None else (1 - EWMA_ALPHA) * previous + EWMA_ALPHA * elapsed_ms
+        self.latency_ms[proxy] = latency
+        self.error_rate[proxy] = (1 - EWMA_ALPHA) * self.error_rate.get(proxy, 0.0) + EWMA_ALPHA * (0.0 if ok else 1.0)
+        
+        # Only rebuild weights when something changed meaningfully (new proxy, big latency move, failure state)
+        changed = previous is None or abs(latency - previous) > WEIGHT_REBUILD_DELTA * previous
+        if ok:
+            changed = changed or self.consecutive_failures.get(proxy, 0) > 0
+            self.consecutive_failures[proxy] = 0
+        else:
+            changed = True
+            failures = self.consecutive_failures.get(proxy, 0) + 1
+            self.consecutive_failures[proxy] = failures
+            if failures > MAX_CONSECUTIVE_FAILURES:
+                self.cooldown_until[proxy] = time.monotonic() + PROXY_COOLDOWN
+                logger.info(f"Proxy {proxy} failed {failures} times in a row, cooling down for {PROXY_COOLDOWN}s")
+        
+        if changed:
+            self._weights = None
     
     def make_request(self, url, max_retries=3, **kwargs):
         """
@@ -230,7 +321,7 @@ class ProxyRotator:
         Args:
             url (str): URL to request
             max_retries (int): Maximum number of proxy retries
-            **kwargs: Additional arguments for requests.get()
+            **kwargs: Additional arguments for requests.Session.get()
             
         Returns:
             requests.Response: Response object or None if all proxies failed
@@ -238,7 +329,7 @@ class ProxyRotator:
         if not self.proxy_pool:
             logger.warning("No proxy pool available, making direct request")
             try:
-                return requests.get(url, **kwargs)
+                return self.session.get(url, **kwargs)
             except Exception as e:
                 logger.error(f"Direct request failed: {e}")
                 return None
@@ -256,7 +347,9 @@ class ProxyRotator:
                 }
                 
                 logger.info(f"Attempt {attempt + 1}: Using proxy {proxy}")
-                response = requests.get(url, proxies=proxy_dict, **kwargs)
+                started = time.monotonic()
+                response = self.session.get(url, proxies=proxy_dict, **kwargs)
+                self.record_result(proxy, time.monotonic() - started, response.status_code == 200)
                 
                 if response.status_code == 200:
                     logger.info(f"✅ Request successful with proxy {proxy}")
@@ -267,6 +360,7 @@ class ProxyRotator:
             except Exception as e:
                 logger.warning(f"❌ Proxy {proxy} failed: {e}")
                 self.failed_proxies.add(proxy)
+                self.record_result(proxy, time.monotonic() - started, False)
                 continue
         
         logger.error("All proxy attempts failed")
@@ -14,9 +14,34 @@ import argparse
 # Add the scraper directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scraper'))
 
+from functools import lru_cache
 from utils import validate_selector_format
 from bs4 import BeautifulSoup
 
+# Sample page every selector is tested against
+TEST_HTML = """
+        <html>
+            <body>
+                <div class="content-right">
+                    <div class="article-container">
+                        <article class="post">
+                            <h4 class="title">Sample Article Title</h4>
+                            <p class="excerpt">Article excerpt...</p>
+                        </article>
+                    </div>
+                </div>
+                <div class="sidebar">
+                    <h4 class="widget-title">Sidebar Title</h4>
+                </div>
+            </body>
+        </html>
+        """
+
+@lru_cache(maxsize=None)
+def get_test_soup() -> BeautifulSoup:
+    """Parse the sample page once and reuse it for every selector (select() does not modify it)"""
+    return BeautifulSoup(TEST_HTML, 'html.parser')
+
 def detailed_validation(selector: str) -> dict:
     """
     Perform detailed validation with comprehensive feedback
@@ -48,25 +73,7 @@ def detailed_validation(selector: str) -> dict:
     
     # Test with BeautifulSoup
     try:
-        test_html = """
-        <html>
-            <body>
-                <div class="content-right">
-                    <div class="article-container">
-                        <article class="post">
-                            <h4 class="title">Sample Article Title</h4>
-                            <p class="excerpt">Article excerpt...</p>
-                        </article>
-                    </div>
-                </div>
-                <div class="sidebar">
-                    <h4 class="widget-title">Sidebar Title</h4>
-                </div>
-            </body>
-        </html>
-        """
-        
-        soup = BeautifulSoup(test_html, 'html.parser')
+        soup = get_test_soup()
         elements = soup.select(selector)
         
         result['is_valid'] = True
@@ -75,7 +82,8 @@ def detailed_validation(selector: str) -> dict:
         if elements:
             result['suggestions'].append(f"✅ Selector matches {len(elements)} element(s) in test HTML")
             for i, elem in enumerate(elements, 1):
-                text = elem.get_text().strip()[:50] + ("..." if len(elem.get_text().strip()) > 50 else "")
+                elem_text = elem.get_text().strip()
+                text = elem_text[:50] + ("..." if len(elem_text) > 50 else "")
                 result['suggestions'].append(f"   Match {i}: <{elem.name}> - '{text}'")
         else:
             result['warnings'].append("⚠️  Selector is valid but matches no elements in test HTML")